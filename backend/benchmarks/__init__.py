@@ -0,0 +1,6 @@
+"""
+Standalone performance benchmarks for the TaskCloud backend.
+
+Run from the backend directory, e.g.:
+    python -m benchmarks.bench_payloads
+"""
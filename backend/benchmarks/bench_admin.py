@@ -0,0 +1,110 @@
+"""
+Task admin changelist page-load cost at scale: stock vs TaskAdmin.
+
+Seeds a scratch database (default 1M tasks over ~2 years), then renders
+the changelist through a stock ModelAdmin (exact COUNT(*), OFFSET paging,
+DISTINCT date drill-down, full rows) and through TaskAdmin (estimated
+count, keyset paging, indexed drill-down, deferred description). Reports
+queries, SQL time and total time per page load.
+
+Run against Postgres (DATABASE_URL=postgres://...) for representative
+numbers; SQLite only has statistics for the unfiltered table, so its
+filtered pages still count exactly.
+
+Usage:
+    python -m benchmarks.bench_admin [--rows 1000000] [--page 500] [--repeat 3]
+"""
+import argparse
+import time
+import uuid
+from datetime import timedelta
+
+from benchmarks.common import create_scratch_database, measure, print_table, setup_django
+
+
+def seed(rows, chunk_size=20000):
+    from django.db import connection
+    from django.utils import timezone
+    from tasks import bulk
+
+    now = timezone.now()
+    span = timedelta(days=730) / rows
+    description = 'Seeded for the admin benchmark. ' * 20
+    for offset in range(0, rows, chunk_size):
+        bulk.insert_rows([
+            (uuid.uuid4(), f'Task {i}', description, now - span * i, None, i % 3 == 0)
+            for i in range(offset, min(offset + chunk_size, rows))
+        ])
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--page', type=int, default=500, help='deep page number to load')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    teardown = create_scratch_database()
+    try:
+        from django.conf import settings
+        from django.contrib import admin
+        from django.contrib.auth import get_user_model
+        from django.db import connection
+        from django.test import RequestFactory
+        from django.test.utils import CaptureQueriesContext
+        from tasks.admin import TaskAdmin
+        from tasks.changelist import CURSOR_VAR, encode_cursor
+        from tasks.models import Task
+
+        class StockTaskAdmin(admin.ModelAdmin):
+            list_display = TaskAdmin.list_display
+            list_filter = TaskAdmin.list_filter
+            date_hierarchy = 'created_at'
+            search_fields = ['title', 'description']
+            ordering = TaskAdmin.ordering
+
+        settings.SLOW_QUERY_THRESHOLD_MS = None  # every stock page load would be logged
+        start = time.perf_counter()
+        seed(args.rows)
+        print(f'Seeded {args.rows:,} tasks ({connection.vendor}) in {time.perf_counter() - start:.1f}s\n')
+
+        user = get_user_model().objects.create_superuser('bench', 'bench@example.com', 'bench')
+        factory = RequestFactory()
+        per_page = TaskAdmin.list_per_page
+        offset = (args.page - 1) * per_page
+        boundary = Task.objects.order_by('-created_at', '-pk').only('created_at')[offset - 1]
+        latest = Task.objects.latest('created_at').created_at
+
+        scenarios = [
+            ('first page', {}, {}),
+            (f'page {args.page}', {'p': str(args.page)}, {CURSOR_VAR: encode_cursor(boundary)}),
+            ('completed filter', {'is_completed__exact': '1'}, {'is_completed__exact': '1'}),
+            ('year drill-down', {'created_at__year': str(latest.year)}, {'created_at__year': str(latest.year)}),
+        ]
+        model_admins = [('stock', StockTaskAdmin(Task, admin.site)), ('TaskAdmin', TaskAdmin(Task, admin.site))]
+
+        rows = []
+        for label, stock_params, params in scenarios:
+            for name, model_admin in model_admins:
+                request = factory.get('/admin/tasks/task/', stock_params if name == 'stock' else params)
+                request.user = user
+
+                def load():
+                    model_admin.changelist_view(request).render()
+
+                with CaptureQueriesContext(connection) as queries:
+                    load()
+                sql_ms = sum(float(query['time']) for query in queries.captured_queries) * 1000
+                total = measure(load, repeat=args.repeat)
+                rows.append([label, name, len(queries), f'{sql_ms:,.1f}', f'{total * 1000:,.1f}'])
+
+        print_table(['page load', 'admin', 'queries', 'SQL ms', 'total ms'], rows)
+    finally:
+        teardown()
+
+
+if __name__ == '__main__':
+    main()
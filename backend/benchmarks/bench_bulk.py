@@ -0,0 +1,76 @@
+"""
+Bulk NDJSON import/export throughput vs the per-request API path.
+
+Seeds a scratch database through three paths and reports rows/sec:
+- one POST /api/tasks/ per task through TaskSerializer (in-process client)
+- tasks.bulk.import_lines (COPY on Postgres, executemany on SQLite)
+- tasks.bulk.export_lines
+
+Usage:
+    python -m benchmarks.bench_bulk [--rows 100000] [--api-rows 1000]
+"""
+import argparse
+import json
+import time
+
+from benchmarks.common import create_scratch_database, print_table, setup_django
+
+
+def generate_lines(count):
+    for i in range(count):
+        yield json.dumps({
+            'title': f'Task {i}',
+            'description': 'Imported for benchmarking',
+            'due_date': '2030-01-01T12:00:00+00:00' if i % 2 else None,
+            'is_completed': i % 3 == 0,
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--api-rows', type=int, default=1000)
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    setup_django()
+    teardown = create_scratch_database()
+    try:
+        from django.conf import settings
+        from django.db import connection
+        from django.test import override_settings
+        from rest_framework.test import APIClient
+        from tasks import bulk
+
+        rows = []
+        unthrottled = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_CLASSES': []}
+        with override_settings(REST_FRAMEWORK=unthrottled):
+            client = APIClient()
+            start = time.perf_counter()
+            for line in generate_lines(args.api_rows):
+                client.post('/api/tasks/', json.loads(line), format='json')
+            api_seconds = time.perf_counter() - start
+        api_rate = args.api_rows / api_seconds
+        rows.append(['POST /api/tasks/ per task', args.api_rows, f'{api_seconds:.2f}', f'{api_rate:,.0f}', '1x'])
+
+        result = bulk.import_lines(generate_lines(args.rows), chunk_size=args.chunk_size)
+        rows.append([
+            f'import_lines ({connection.vendor})', result.imported, f'{result.seconds:.2f}',
+            f'{result.rows_per_sec:,.0f}', f'{result.rows_per_sec / api_rate:,.0f}x',
+        ])
+
+        start = time.perf_counter()
+        exported = sum(1 for _ in bulk.export_lines(chunk_size=args.chunk_size))
+        export_seconds = time.perf_counter() - start
+        rows.append([
+            'export_lines', exported, f'{export_seconds:.2f}',
+            f'{exported / export_seconds:,.0f}', '',
+        ])
+
+        print_table(['path', 'rows', 'seconds', 'rows/sec', 'vs API'], rows)
+    finally:
+        teardown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Per-request middleware overhead: full MIDDLEWARE vs LEAN_MIDDLEWARE.
+
+Calls the WSGI handlers in-process on /health/ (a trivial view that never
+touches the database), so the difference is almost entirely middleware.
+
+Usage:
+    python -m benchmarks.bench_middleware [--requests 5000]
+"""
+import argparse
+from io import BytesIO
+
+from benchmarks.common import measure, print_table, setup_django
+
+
+def make_environ(path):
+    from wsgiref.util import setup_testing_defaults
+    environ = {'PATH_INFO': path, 'HTTP_HOST': 'localhost', 'wsgi.input': BytesIO()}
+    setup_testing_defaults(environ)
+    return environ
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--path', default='/health/')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.core.handlers.wsgi import WSGIHandler
+    from taskcloud.dispatch import build_handler
+
+    def start_response(status, headers, exc_info=None):
+        pass
+
+    handlers = [
+        ('full', len(settings.MIDDLEWARE), WSGIHandler()),
+        ('lean', len(settings.LEAN_MIDDLEWARE), build_handler(WSGIHandler, settings.LEAN_MIDDLEWARE)),
+    ]
+    rows = []
+    baseline = None
+    for name, depth, handler in handlers:
+        def request():
+            b''.join(handler(make_environ(args.path), start_response))
+        request()  # warm URL resolver and view imports
+        per_request = measure(request, repeat=5, number=args.requests)
+        baseline = baseline or per_request
+        rows.append([name, depth, f'{per_request * 1e6:.1f}', f'{per_request / baseline:.2f}'])
+
+    print(f'{args.requests} x GET {args.path}\n')
+    print_table(['chain', 'middleware', 'us/request', 'ratio'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Payload-size and encode/decode-time benchmark for task list responses.
+
+Compares the full JSON list payload against sparse fieldsets
+(`?fields=...`) and the MessagePack wire format.
+
+Usage:
+    python -m benchmarks.bench_payloads [--tasks 1000] [--description-size 500]
+"""
+import argparse
+
+from benchmarks.common import measure, print_table, setup_django
+
+
+def build_payloads(count, description_size):
+    from datetime import timedelta
+    from django.utils import timezone
+    from tasks.models import Task
+    from tasks.serializers import TaskSerializer
+
+    now = timezone.now()
+    tasks = [
+        Task(
+            title=f'Task {i}',
+            description='x' * description_size,
+            created_at=now,
+            due_date=now + timedelta(days=1) if i % 2 else None,
+            is_completed=bool(i % 3 == 0),
+        )
+        for i in range(count)
+    ]
+    return {
+        'full': TaskSerializer(tasks, many=True).data,
+        'fields=id,title,is_completed': TaskSerializer(
+            tasks, many=True, fields=['id', 'title', 'is_completed'],
+        ).data,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tasks', type=int, default=1000)
+    parser.add_argument('--description-size', type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+    from rest_framework.parsers import JSONParser
+    import io
+
+    renderers = [('json', JSONRenderer(), JSONParser())]
+    try:
+        from tasks.renderers import MessagePackRenderer
+        from tasks.parsers import MessagePackParser
+        renderers.append(('msgpack', MessagePackRenderer(), MessagePackParser()))
+    except ImportError:
+        print('msgpack not installed; skipping MessagePack rows\n')
+
+    rows = []
+    baseline = None
+    for shape, data in build_payloads(args.tasks, args.description_size).items():
+        for fmt, renderer, parser in renderers:
+            body = renderer.render(data)
+            encode = measure(lambda: renderer.render(data))
+            decode = measure(lambda: parser.parse(io.BytesIO(body)))
+            if baseline is None:
+                baseline = len(body)
+            rows.append([
+                shape, fmt, len(body), f'{len(body) / baseline:.2f}',
+                f'{encode * 1000:.2f}', f'{decode * 1000:.2f}',
+            ])
+
+    print(f'{args.tasks} tasks, {args.description_size}-byte descriptions\n')
+    print_table(['payload', 'format', 'bytes', 'ratio', 'encode ms', 'decode ms'], rows)
+
+
+if __name__ == '__main__':
+    main()
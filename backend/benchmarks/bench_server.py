@@ -0,0 +1,184 @@
+"""
+Memory per worker and throughput for each gunicorn server profile.
+
+For each profile the script starts `gunicorn -c gunicorn.conf.py` against
+a throwaway SQLite database, drives it with keep-alive HTTP clients for a
+fixed duration, and reads each worker's RSS and PSS from /proc (Linux).
+PSS divides shared pages between the processes sharing them, so a drop in
+PSS with preload shows the copy-on-write savings.
+
+Usage:
+    python -m benchmarks.bench_server [--duration 10] [--clients 8] [--workers 2]
+        [--path /api/tasks/] [--profiles sync,sync-preload,gthread-preload,uvicorn-preload]
+"""
+import argparse
+import http.client
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.common import BACKEND_DIR, print_table
+
+PROFILES = {
+    'sync': {'GUNICORN_WORKER_CLASS': 'sync', 'GUNICORN_PRELOAD': 'false'},
+    'sync-preload': {'GUNICORN_WORKER_CLASS': 'sync', 'GUNICORN_PRELOAD': 'true'},
+    'gthread-preload': {'GUNICORN_WORKER_CLASS': 'gthread', 'GUNICORN_PRELOAD': 'true'},
+    'uvicorn-preload': {'GUNICORN_WORKER_CLASS': 'uvicorn', 'GUNICORN_PRELOAD': 'true'},
+}
+
+
+def memory_kb(pid):
+    """Return (rss, pss) in kB for a process from /proc."""
+    values = {}
+    try:
+        for line in Path(f'/proc/{pid}/smaps_rollup').read_text().splitlines():
+            key, _, rest = line.partition(':')
+            if key in ('Rss', 'Pss'):
+                values[key] = int(rest.split()[0])
+    except OSError:
+        return None, None
+    return values.get('Rss'), values.get('Pss')
+
+
+def child_pids(pid):
+    try:
+        return [int(p) for p in Path(f'/proc/{pid}/task/{pid}/children').read_text().split()]
+    except OSError:
+        return []
+
+
+def wait_ready(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/health/')
+            if conn.getresponse().status == 200:
+                return True
+        except OSError:
+            time.sleep(0.2)
+    return False
+
+
+def load(port, path, clients, duration):
+    """Run keep-alive GET loops; return (requests, errors, latencies)."""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        local = []
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            try:
+                conn.request('GET', path, headers={'Accept': 'application/json'})
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise OSError(response.status)
+                local.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                with lock:
+                    errors[0] += 1
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), errors[0], latencies
+
+
+def prepare_database(env, tasks=50):
+    subprocess.run([sys.executable, 'manage.py', 'migrate', '-v0'], cwd=BACKEND_DIR, env=env, check=True)
+    lines = ''.join(json.dumps({'title': f'Task {i}', 'description': 'x' * 200}) + '\n' for i in range(tasks))
+    subprocess.run(
+        [sys.executable, 'manage.py', 'import_tasks', '-'], cwd=BACKEND_DIR, env=env,
+        input=lines.encode(), check=True, stdout=subprocess.DEVNULL,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--port', type=int, default=8799)
+    parser.add_argument('--path', default='/api/tasks/')
+    parser.add_argument('--profiles', default=','.join(PROFILES))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            'DATABASE_URL': f'sqlite:///{tmp}/bench.sqlite3',
+            'DJANGO_DEBUG': 'false',
+            'DJANGO_ALLOWED_HOSTS': '127.0.0.1,localhost',
+            'GUNICORN_BIND': f'127.0.0.1:{args.port}',
+            'GUNICORN_WORKERS': str(args.workers),
+            'GUNICORN_LOG_LEVEL': 'warning',
+            'GUNICORN_ACCESS_LOG': '',
+            'GUNICORN_MAX_REQUESTS': '0',
+            'SLOW_QUERY_THRESHOLD_MS': '',
+            'DJANGO_THROTTLE_ANON': '',
+        }
+        prepare_database(env)
+
+        rows = []
+        for name in args.profiles.split(','):
+            profile_env = {**env, **PROFILES[name]}
+            if name.startswith('uvicorn'):
+                try:
+                    import uvicorn_worker  # noqa: F401
+                except ImportError:
+                    print(f'{name}: uvicorn-worker not installed, skipping')
+                    continue
+            server = subprocess.Popen(
+                [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'],
+                cwd=BACKEND_DIR, env=profile_env,
+            )
+            try:
+                if not wait_ready(args.port):
+                    print(f'{name}: server did not start')
+                    continue
+                load(args.port, args.path, args.clients, 1)  # warm
+                count, errors, latencies = load(args.port, args.path, args.clients, args.duration)
+                workers = child_pids(server.pid)
+                memory = [memory_kb(pid) for pid in workers]
+                rss = [m[0] for m in memory if m[0]]
+                pss = [m[1] for m in memory if m[1]]
+                latencies.sort()
+                rows.append([
+                    name, len(workers),
+                    f'{count / args.duration:,.0f}',
+                    f'{statistics.median(latencies) * 1000:.1f}' if latencies else '-',
+                    f'{latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f}' if latencies else '-',
+                    errors,
+                    f'{statistics.mean(rss) / 1024:.1f}' if rss else '-',
+                    f'{statistics.mean(pss) / 1024:.1f}' if pss else '-',
+                ])
+            finally:
+                server.send_signal(signal.SIGTERM)
+                server.wait(timeout=30)
+
+    print(f'\nGET {args.path}, {args.clients} clients, {args.duration:.0f}s per profile\n')
+    print_table(
+        ['profile', 'workers', 'req/s', 'p50 ms', 'p99 ms', 'errors', 'RSS MB/worker', 'PSS MB/worker'],
+        rows,
+    )
+
+
+if __name__ == '__main__':
+    main()
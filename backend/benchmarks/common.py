@@ -0,0 +1,66 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are plain scripts rather than tests: they bootstrap Django
+themselves, optionally build a throwaway test database, and print a
+small results table.
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """Configure Django settings and the app registry for a script."""
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'taskcloud.settings')
+    import django
+    django.setup()
+
+
+def create_scratch_database():
+    """
+    Create and migrate a throwaway test database.
+
+    Uses the same backend as DATABASES['default'] (in-memory SQLite by
+    default, a `test_` database on Postgres when DATABASE_URL is set).
+    Returns a callable that destroys it again.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+    def teardown():
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    return teardown
+
+
+def measure(func, repeat=5, number=1):
+    """Return the median wall time in seconds of `number` calls to func."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples)
+
+
+def print_table(headers, rows):
+    """Print rows as a left-aligned plain-text table."""
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max([len(h)] + [len(r[i]) for r in rows]) for i, h in enumerate(headers)]
+    line = '  '.join(h.ljust(w) for h, w in zip(headers, widths)).rstrip()
+    print(line)
+    print('-' * len(line))
+    for row in rows:
+        print('  '.join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip())
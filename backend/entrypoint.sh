@@ -1,25 +1,22 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-# Default to 2 workers for gunicorn unless overridden
-: "${GUNICORN_WORKERS:=2}"
+# Worker count, class, preload and recycling come from gunicorn.conf.py
+# (GUNICORN_* environment variables).
 : "${GUNICORN_BIND:=0.0.0.0:8000}"
+export GUNICORN_BIND
 
+# Wait until the database accepts queries (not just TCP connections).
+# Only the database probes: the queue probe needs tables that migrate
+# creates below.
 echo "Waiting for PostgreSQL..."
-while ! nc -z ${POSTGRES_HOST:-postgres} ${POSTGRES_PORT:-5432}; do
-  sleep 1
-done
+python manage.py check_ready --databases-only --wait "${READY_WAIT_SECONDS:-60}"
 echo "PostgreSQL is ready!"
 
 # Run database migrations
 echo "Running migrations..."
 python manage.py migrate --noinput
 
-# Start gunicorn (Django WSGI) - bind to 0.0.0.0 for external reverse proxy
+# Start gunicorn (Django WSGI/ASGI) - bind to 0.0.0.0 for external reverse proxy
 echo "Starting gunicorn on ${GUNICORN_BIND}..."
-exec gunicorn taskcloud.wsgi:application \
-  --workers "$GUNICORN_WORKERS" \
-  --bind "$GUNICORN_BIND" \
-  --access-logfile - \
-  --error-logfile - \
-  --log-level info
+exec gunicorn -c gunicorn.conf.py
@@ -0,0 +1,116 @@
+"""
+Gunicorn server profile for TaskCloud, configured from the environment.
+
+    gunicorn -c gunicorn.conf.py
+
+Environment variables (defaults in brackets):
+    GUNICORN_BIND                 [0.0.0.0:8000]
+    GUNICORN_WORKER_CLASS         sync | gthread | uvicorn  [gthread]
+    GUNICORN_WORKERS              [2 * usable CPU cores + 1, capped by GUNICORN_MAX_WORKERS]
+    GUNICORN_MAX_WORKERS          [8]
+    GUNICORN_THREADS              threads per gthread worker [4]
+    GUNICORN_PRELOAD              load the app once in the master and fork it [true]
+    GUNICORN_MAX_REQUESTS         recycle a worker after this many requests, 0 = never [1000]
+    GUNICORN_MAX_REQUESTS_JITTER  random extra requests so workers don't recycle together [10% of max]
+    GUNICORN_TIMEOUT              seconds before a silent worker is killed [30]
+    GUNICORN_GRACEFUL_TIMEOUT     seconds to finish in-flight requests on restart [30]
+    GUNICORN_KEEPALIVE            seconds to hold idle keep-alive connections [5]
+    GUNICORN_WARMUP               prime caches after fork (and the DB connection for sync) [true]
+    GUNICORN_LOG_LEVEL            [info]
+    GUNICORN_ACCESS_LOG           access log target, empty to disable [-]
+
+With preload_app, the master imports Django once; database connections
+are closed and the heap is frozen (gc.freeze) before each fork so workers
+share those pages copy-on-write instead of each holding a private copy.
+"""
+import gc
+import importlib.util
+import os
+
+
+def _env_bool(name, default):
+    return os.environ.get(name, str(default)).lower() in ('1', 'true', 'yes')
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def _cpu_count():
+    # CPUs this process may run on (container cpusets), not the host's.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS
+        return os.cpu_count() or 1
+
+
+_WORKER_CLASSES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    'uvicorn': 'uvicorn_worker.UvicornWorker',
+}
+
+_profile = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+if _profile not in _WORKER_CLASSES:
+    raise RuntimeError(
+        f'GUNICORN_WORKER_CLASS must be one of {", ".join(_WORKER_CLASSES)}, got {_profile!r}'
+    )
+if _profile == 'uvicorn' and importlib.util.find_spec('uvicorn_worker') is None:
+    raise RuntimeError(
+        'GUNICORN_WORKER_CLASS=uvicorn needs the uvicorn-worker package (see requirements.txt)'
+    )
+
+# Application: ASGI for uvicorn workers, WSGI otherwise. Both entry points
+# route /api/ and /health/ through the lean middleware chain.
+wsgi_app = 'taskcloud.asgi:application' if _profile == 'uvicorn' else 'taskcloud.wsgi:application'
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+worker_class = _WORKER_CLASSES[_profile]
+workers = _env_int(
+    'GUNICORN_WORKERS',
+    min(_cpu_count() * 2 + 1, _env_int('GUNICORN_MAX_WORKERS', 8)),
+)
+threads = _env_int('GUNICORN_THREADS', 4) if _profile == 'gthread' else 1
+
+preload_app = _env_bool('GUNICORN_PRELOAD', True)
+
+max_requests = _env_int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _env_int('GUNICORN_MAX_REQUESTS_JITTER', max_requests // 10)
+
+timeout = _env_int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = _env_int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _env_int('GUNICORN_KEEPALIVE', 5)
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+_warmup = _env_bool('GUNICORN_WARMUP', True)
+
+
+def when_ready(server):
+    """With preload, do import-time warmup once in the master so workers inherit it."""
+    if preload_app and _warmup:
+        from taskcloud.warmup import warm_up
+        seconds = warm_up(connect=False)
+        server.log.info('Master warmed up in %.1fms', seconds * 1000)
+
+
+def pre_fork(server, worker):
+    """Drop inherited DB sockets and freeze the preloaded heap before forking."""
+    if preload_app:
+        from django.db import connections
+        connections.close_all()
+        # Objects created so far move to a permanent generation the cyclic
+        # GC never scans, so collections in workers don't dirty shared pages.
+        gc.freeze()
+
+
+def post_worker_init(worker):
+    """Warm per-process caches before accepting requests."""
+    if _warmup:
+        from taskcloud.warmup import warm_up
+        # Django connections are per thread: only sync workers serve
+        # requests on this (main) thread and would reuse the connection.
+        seconds = warm_up(connect=_profile == 'sync')
+        worker.log.info('Worker %s warmed up in %.1fms', worker.pid, seconds * 1000)
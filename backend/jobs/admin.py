@@ -0,0 +1,23 @@
+"""
+Django admin configuration for jobs app.
+
+Read-mostly view of the background job queue for monitoring.
+"""
+from django.contrib import admin
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """
+    Admin interface for Job model.
+
+    Provides:
+    - List display with status, attempts and timing
+    - Filtering by status and job name
+    - Read-only fields for worker-managed data
+    """
+    list_display = ['name', 'status', 'attempts', 'run_at', 'duration', 'finished_at']
+    list_filter = ['status', 'name']
+    readonly_fields = ['attempts', 'last_error', 'locked_by', 'locked_at', 'duration', 'created_at', 'finished_at']
+    ordering = ['-created_at']
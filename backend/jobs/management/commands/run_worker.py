@@ -0,0 +1,63 @@
+"""
+Management command to run background job workers.
+
+Claims jobs from the database queue and runs their registered handlers.
+Stops cleanly on SIGTERM/SIGINT and prints per-job timing metrics.
+
+Usage:
+    python manage.py run_worker [--concurrency 2] [--poll-interval 1.0] [--burst]
+"""
+import signal
+
+from django.core.management.base import BaseCommand
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = 'Runs background job workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=1,
+            help='Number of worker threads',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds an idle worker waits before polling the queue again',
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Run until the queue is empty, then exit',
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            concurrency=options['concurrency'],
+            poll_interval=options['poll_interval'],
+        )
+        if options['burst']:
+            worker.maintain()
+            worker.run_pending()
+        else:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, lambda *_: worker.stop_event.set())
+            self.stdout.write(
+                f'Worker {worker.worker_id} started with {worker.concurrency} thread(s)'
+            )
+            worker.run()
+        self.write_metrics(worker.metrics.snapshot())
+
+    def write_metrics(self, metrics):
+        if not metrics:
+            self.stdout.write('No jobs processed')
+            return
+        for name, stats in metrics.items():
+            self.stdout.write(
+                f"{name}: {stats['runs']} runs, {stats['failures']} failures, "
+                f"mean {stats['mean'] * 1000:.1f}ms, max {stats['max'] * 1000:.1f}ms"
+            )
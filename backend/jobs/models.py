@@ -0,0 +1,63 @@
+"""
+Job model for the database-backed background queue.
+
+Jobs are rows claimed by `run_worker` processes with
+SELECT ... FOR UPDATE SKIP LOCKED on Postgres, or an optimistic
+conditional UPDATE on SQLite (see jobs.queue).
+"""
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    A unit of deferred work.
+
+    Attributes:
+        name: Registered handler name (see jobs.registry).
+        payload: JSON arguments passed to the handler.
+        status: queued, running, succeeded or failed.
+        run_at: Earliest time the job may run (used for deferral and backoff).
+        attempts: Number of times the job has been claimed.
+        max_attempts: Attempts allowed before the job is marked failed.
+        last_error: Traceback of the most recent failure.
+        locked_by: Worker that currently holds the job.
+        locked_at: When the job was claimed.
+        duration: Seconds the most recent attempt took.
+        created_at: When the job was enqueued.
+        finished_at: When the job succeeded or finally failed.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'Queued'
+        RUNNING = 'running', 'Running'
+        SUCCEEDED = 'succeeded', 'Succeeded'
+        FAILED = 'failed', 'Failed'
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED)
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    last_error = models.TextField(blank=True, default='')
+    locked_by = models.CharField(max_length=100, blank=True, default='')
+    locked_at = models.DateTimeField(null=True, blank=True)
+    duration = models.FloatField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['run_at']
+        indexes = [
+            # Claim path: oldest runnable queued job first.
+            models.Index(
+                fields=['run_at'],
+                name='job_queued_run_at_idx',
+                condition=models.Q(status='queued'),
+            ),
+            models.Index(fields=['status', 'locked_at'], name='job_status_locked_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.name} [{self.status}]'
@@ -0,0 +1,167 @@
+"""
+Enqueue and claim jobs.
+
+Claiming uses SELECT ... FOR UPDATE SKIP LOCKED where the database
+supports it (Postgres), so concurrent workers never block on or double
+claim a row. Elsewhere (SQLite) a worker reads a few candidate ids and
+claims one with a conditional UPDATE, which only one worker can win.
+"""
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+DEFAULT_BACKOFF = timedelta(seconds=10)
+DEFAULT_MAX_BACKOFF = timedelta(hours=1)
+_CANDIDATES = 10
+
+
+def enqueue(name, payload=None, run_at=None, max_attempts=None):
+    """Add a job to the queue and return it."""
+    fields = {'name': name, 'payload': payload or {}}
+    if run_at is not None:
+        fields['run_at'] = run_at
+    if max_attempts is not None:
+        fields['max_attempts'] = max_attempts
+    return Job.objects.create(**fields)
+
+
+def enqueue_unique(name, payload=None, run_at=None):
+    """
+    Enqueue `name` unless an unfinished job with that name already exists.
+
+    Used for periodic work, where a second copy would only repeat the
+    same pass. Returns the new job, or None if one was already pending.
+    """
+    pending = Job.objects.filter(name=name, status__in=[Job.Status.QUEUED, Job.Status.RUNNING])
+    if pending.exists():
+        return None
+    return enqueue(name, payload, run_at)
+
+
+def _runnable(now):
+    return Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=now).order_by('run_at')
+
+
+def claim(worker_id, now=None):
+    """
+    Claim the oldest runnable job for `worker_id`.
+
+    Returns:
+        The claimed Job (status running, attempts incremented), or None.
+    """
+    now = now or timezone.now()
+    claim_fields = {
+        'status': Job.Status.RUNNING,
+        'locked_by': worker_id,
+        'locked_at': now,
+        'attempts': F('attempts') + 1,
+    }
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = _runnable(now).select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            Job.objects.filter(pk=job.pk).update(**claim_fields)
+    else:
+        job = None
+        for pk in _runnable(now).values_list('pk', flat=True)[:_CANDIDATES]:
+            if Job.objects.filter(pk=pk, status=Job.Status.QUEUED).update(**claim_fields):
+                job = Job(pk=pk)
+                break
+        if job is None:
+            return None
+    job.refresh_from_db()
+    return job
+
+
+def backoff_delay(attempts):
+    """Exponential backoff with jitter for the given attempt count."""
+    base = getattr(settings, 'JOB_RETRY_BACKOFF', DEFAULT_BACKOFF)
+    cap = getattr(settings, 'JOB_RETRY_MAX_BACKOFF', DEFAULT_MAX_BACKOFF)
+    delay = min(base * (2 ** max(attempts - 1, 0)), cap)
+    return delay * random.uniform(0.5, 1.0)
+
+
+def mark_succeeded(job, duration):
+    now = timezone.now()
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.Status.SUCCEEDED,
+        duration=duration,
+        finished_at=now,
+        locked_by='',
+        locked_at=None,
+        last_error='',
+    )
+
+
+def mark_failed(job, duration, error):
+    """Requeue `job` with backoff, or fail it once attempts are used up."""
+    now = timezone.now()
+    fields = {'duration': duration, 'last_error': error, 'locked_by': '', 'locked_at': None}
+    if job.attempts < job.max_attempts:
+        fields.update(status=Job.Status.QUEUED, run_at=now + backoff_delay(job.attempts))
+    else:
+        fields.update(status=Job.Status.FAILED, finished_at=now)
+    Job.objects.filter(pk=job.pk).update(**fields)
+
+
+def requeue_stale(older_than, now=None):
+    """
+    Return jobs stuck in running (e.g. their worker died) to the queue.
+
+    Live workers refresh locked_at (see heartbeat), so only jobs whose
+    worker stopped heartbeating for `older_than` are affected. A lost
+    worker counts as a failed attempt: the job is retried with the usual
+    backoff, or failed once its attempts are used up, so a job that keeps
+    killing its worker does not cycle forever.
+
+    Returns:
+        (requeued, failed) job counts.
+    """
+    now = now or timezone.now()
+    stale = Job.objects.filter(status=Job.Status.RUNNING, locked_at__lt=now - older_than)
+    error = f'Worker lost: no heartbeat for {older_than}'
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.Status.FAILED, finished_at=now, last_error=error, locked_by='', locked_at=None,
+    )
+    requeued = 0
+    # Each job backs off by its own attempt count; stale jobs are rare.
+    for pk, attempts in stale.values_list('pk', 'attempts'):
+        # Conditional on staleness still holding, in case a heartbeat landed.
+        requeued += stale.filter(pk=pk).update(
+            status=Job.Status.QUEUED, run_at=now + backoff_delay(attempts),
+            last_error=error, locked_by='', locked_at=None,
+        )
+    return requeued, failed
+
+
+def heartbeat(job_ids, now=None):
+    """
+    Refresh locked_at on running jobs so requeue_stale leaves them alone.
+
+    Returns:
+        The number of jobs updated.
+    """
+    if not job_ids:
+        return 0
+    return Job.objects.filter(pk__in=job_ids, status=Job.Status.RUNNING).update(
+        locked_at=now or timezone.now(),
+    )
+
+
+def prune_finished(status, older_than, now=None):
+    """
+    Delete jobs with `status` (succeeded or failed) finished before `older_than` ago.
+
+    Returns:
+        The number of jobs deleted.
+    """
+    now = now or timezone.now()
+    deleted, _ = Job.objects.filter(status=status, finished_at__lt=now - older_than).delete()
+    return deleted
@@ -0,0 +1,36 @@
+"""
+Registry of job handlers.
+
+Apps declare handlers in a `jobs.py` module, which JobsConfig.ready()
+autodiscovers:
+
+    from jobs.registry import register
+
+    @register('tasks.cleanup_expired')
+    def cleanup_expired(payload):
+        ...
+"""
+_handlers = {}
+
+
+class UnknownJobError(LookupError):
+    """Raised when a job name has no registered handler."""
+
+
+def register(name):
+    """Decorator registering `func(payload)` as the handler for `name`."""
+    def decorator(func):
+        _handlers[name] = func
+        return func
+    return decorator
+
+
+def get_handler(name):
+    try:
+        return _handlers[name]
+    except KeyError:
+        raise UnknownJobError(f'No job handler registered for {name!r}') from None
+
+
+def registered_names():
+    return sorted(_handlers)
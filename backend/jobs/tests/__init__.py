@@ -0,0 +1,3 @@
+"""
+Test suite initialization for jobs app.
+"""
@@ -0,0 +1,269 @@
+"""
+Tests for the database-backed job queue and worker.
+"""
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.utils import timezone
+from jobs import queue
+from jobs.models import Job
+from jobs.registry import register
+from jobs.worker import Worker
+from tasks.models import Task
+
+calls = []
+
+
+@register('test.record')
+def record(payload):
+    calls.append(payload)
+
+
+@register('test.explode')
+def explode(payload):
+    raise RuntimeError('boom')
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.mark.django_db
+class TestJobQueue:
+    """Test suite for enqueueing and claiming jobs."""
+
+    def test_claim_oldest_runnable(self):
+        """
+        Test claim returns the earliest runnable job and marks it running.
+        """
+        now = timezone.now()
+        queue.enqueue('test.record', run_at=now + timedelta(minutes=5))
+        first = queue.enqueue('test.record', run_at=now - timedelta(minutes=1))
+
+        job = queue.claim('w1')
+
+        assert job.pk == first.pk
+        assert job.status == Job.Status.RUNNING
+        assert job.attempts == 1
+        assert job.locked_by == 'w1'
+        assert queue.claim('w2') is None
+
+    def test_enqueue_unique(self):
+        """
+        Test enqueue_unique skips names that already have a pending job.
+        """
+        assert queue.enqueue_unique('test.record') is not None
+        assert queue.enqueue_unique('test.record') is None
+
+    def test_requeue_stale(self):
+        """
+        Test jobs left running past JOB_STALE_AFTER are requeued.
+        """
+        queue.enqueue('test.record')
+        queue.claim('w1')
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+
+        assert queue.requeue_stale(timedelta(minutes=15)) == (1, 0)
+        job = Job.objects.get()
+        assert job.status == Job.Status.QUEUED
+        assert job.run_at > timezone.now()
+        assert 'Worker lost' in job.last_error
+
+    def test_requeue_stale_fails_exhausted_jobs(self):
+        """
+        Test a stale job with no attempts left fails instead of cycling forever.
+        """
+        queue.enqueue('test.record', max_attempts=1)
+        queue.claim('w1')
+        Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+
+        assert queue.requeue_stale(timedelta(minutes=15)) == (0, 1)
+        job = Job.objects.get()
+        assert job.status == Job.Status.FAILED
+        assert job.finished_at is not None
+
+    def test_prune_finished(self):
+        """
+        Test only finished jobs of the given status past retention are deleted.
+        """
+        now = timezone.now()
+        old = queue.enqueue('test.record')
+        recent = queue.enqueue('test.record')
+        failed = queue.enqueue('test.record')
+        Job.objects.filter(pk=old.pk).update(status=Job.Status.SUCCEEDED, finished_at=now - timedelta(days=8))
+        Job.objects.filter(pk=recent.pk).update(status=Job.Status.SUCCEEDED, finished_at=now)
+        Job.objects.filter(pk=failed.pk).update(status=Job.Status.FAILED, finished_at=now - timedelta(days=8))
+
+        assert queue.prune_finished(Job.Status.SUCCEEDED, timedelta(days=7), now) == 1
+        assert set(Job.objects.values_list('pk', flat=True)) == {recent.pk, failed.pk}
+
+
+@pytest.mark.django_db
+class TestWorker:
+    """Test suite for running jobs, retries and metrics."""
+
+    def test_runs_job(self):
+        """
+        Test a worker runs the handler and records success and timing.
+        """
+        queue.enqueue('test.record', {'n': 1})
+        worker = Worker(periodic={})
+
+        assert worker.run_pending() == 1
+        assert calls == [{'n': 1}]
+        job = Job.objects.get()
+        assert job.status == Job.Status.SUCCEEDED
+        assert job.duration is not None
+        assert worker.metrics.snapshot()['test.record']['runs'] == 1
+
+    def test_retry_with_backoff_then_fail(self):
+        """
+        Test a failing job is requeued with a later run_at until max_attempts.
+        """
+        queue.enqueue('test.explode', max_attempts=2)
+        worker = Worker(periodic={})
+
+        worker.run_pending()
+        job = Job.objects.get()
+        assert job.status == Job.Status.QUEUED
+        assert job.run_at > timezone.now()
+        assert 'boom' in job.last_error
+
+        Job.objects.update(run_at=timezone.now())
+        worker.run_pending()
+        job.refresh_from_db()
+        assert job.status == Job.Status.FAILED
+        assert job.attempts == 2
+        assert worker.metrics.snapshot()['test.explode']['failures'] == 2
+
+    def test_unknown_job_fails(self):
+        """
+        Test a job without a registered handler is recorded as a failure.
+        """
+        queue.enqueue('test.missing', max_attempts=1)
+
+        Worker(periodic={}).run_pending()
+
+        assert Job.objects.get().status == Job.Status.FAILED
+
+    def test_periodic_jobs(self):
+        """
+        Test maintain() enqueues due periodic jobs once per interval.
+        """
+        worker = Worker(periodic={'test.record': 60})
+        now = timezone.now()
+
+        worker.maintain(now)
+        worker.run_pending()
+        worker.maintain(now + timedelta(seconds=30))
+        assert worker.run_pending() == 0
+        worker.maintain(now + timedelta(seconds=61))
+        assert worker.run_pending() == 1
+
+    def test_heartbeat_keeps_long_job_claimed(self, monkeypatch):
+        """
+        Test a running job's heartbeat stops requeue_stale from taking it.
+        """
+        queue.enqueue('test.record')
+        worker = Worker(periodic={})
+        requeued = []
+
+        def long_job(job):
+            Job.objects.update(locked_at=timezone.now() - timedelta(hours=1))
+            worker.heartbeat()
+            requeued.append(queue.requeue_stale(timedelta(minutes=15)))
+
+        monkeypatch.setattr(worker, 'run_job', long_job)
+        worker.run_pending()
+
+        assert requeued == [(0, 0)]
+        assert worker.heartbeat() == 0
+
+    def test_maintain_prunes_hourly(self):
+        """
+        Test maintain() prunes finished jobs past JOB_RETENTION at most hourly.
+        """
+        now = timezone.now()
+        worker = Worker(periodic={})
+        queue.enqueue('test.record')
+        Job.objects.update(status=Job.Status.SUCCEEDED, finished_at=now - timedelta(days=8))
+
+        worker.maintain(now)
+        assert not Job.objects.exists()
+
+        queue.enqueue('test.record')
+        Job.objects.update(status=Job.Status.SUCCEEDED, finished_at=now - timedelta(days=8))
+        worker.maintain(now + timedelta(minutes=30))
+        assert Job.objects.exists()
+        worker.maintain(now + timedelta(minutes=61))
+        assert not Job.objects.exists()
+
+    def test_periodic_schedule_survives_restart(self):
+        """
+        Test a new worker waits out the interval since the newest job of that name.
+        """
+        now = timezone.now()
+        Worker(periodic={'test.record': 60}).maintain(now)
+        Job.objects.update(status=Job.Status.SUCCEEDED, created_at=now)
+
+        restarted = Worker(periodic={'test.record': 60})
+        restarted.maintain(now + timedelta(seconds=30))
+        assert Job.objects.count() == 1
+        restarted.maintain(now + timedelta(seconds=61))
+        assert Job.objects.count() == 2
+
+    def test_run_worker_burst(self):
+        """
+        Test run_worker --burst drains the queue using the tasks handlers.
+        """
+        Task.objects.create(title='Old')
+        Task.objects.update(created_at=timezone.now() - timedelta(hours=2))
+        queue.enqueue('tasks.cleanup_expired')
+        out = StringIO()
+
+        call_command('run_worker', '--burst', stdout=out)
+
+        assert not Task.objects.exists()
+        assert 'tasks.cleanup_expired: 1 runs' in out.getvalue()
+
+    def test_cleanup_job_is_silent(self, capsys):
+        """
+        Test the cleanup job does not print the command's summary line.
+        """
+        queue.enqueue('tasks.cleanup_expired')
+
+        Worker(periodic={}).run_pending()
+
+        assert Job.objects.get().status == Job.Status.SUCCEEDED
+        assert capsys.readouterr().out == ''
+
+
+class TestWorkerLoop:
+    """Test suite for the worker thread loop."""
+
+    def test_loop_survives_errors(self, monkeypatch):
+        """
+        Test a database error is logged, the connection checked and the thread keeps looping.
+        """
+        worker = Worker(poll_interval=0, periodic={})
+        attempts = []
+
+        def maintain():
+            attempts.append('maintain')
+            if attempts.count('maintain') == 1:
+                raise DatabaseError('server closed the connection unexpectedly')
+
+        def run_pending(thread_id):
+            worker.stop_event.set()
+            return 0
+
+        monkeypatch.setattr(worker, 'maintain', maintain)
+        monkeypatch.setattr(worker, 'run_pending', run_pending)
+        monkeypatch.setattr('jobs.worker.close_old_connections', lambda: attempts.append('close'))
+
+        worker._loop(0)
+
+        assert attempts == ['close', 'maintain', 'close', 'close', 'maintain']
@@ -0,0 +1,206 @@
+"""
+Job worker: claims jobs from the queue and runs their handlers.
+
+A Worker runs `concurrency` threads, each with its own database
+connection, looping claim -> run -> record. When idle a thread waits
+`poll_interval` before trying again. One thread also enqueues the
+periodic jobs from settings.JOB_PERIODIC when they come due (measured
+from each name's newest job, so restarts keep the schedule), retries or
+fails jobs left running by crashed workers and prunes finished jobs older than
+settings.JOB_RETENTION.
+
+A heartbeat thread refreshes locked_at on the jobs this worker is running
+every JOB_STALE_AFTER / 3, so long jobs are not mistaken for stale ones.
+A thread that hits an error (e.g. the database went away) logs it and
+retries with backoff instead of exiting.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from taskcloud.slow_queries import query_source
+from . import queue
+from .models import Job
+from .registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STALE_AFTER = timedelta(minutes=15)
+DEFAULT_RETENTION = {'succeeded': timedelta(days=7), 'failed': timedelta(days=30)}
+PRUNE_INTERVAL = timedelta(hours=1)
+MAX_ERROR_BACKOFF = 60.0
+
+
+class JobMetrics:
+    """Thread-safe per-job-name counters and timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {'runs': 0, 'failures': 0, 'total': 0.0, 'max': 0.0})
+
+    def record(self, name, duration, ok):
+        with self._lock:
+            stats = self._stats[name]
+            stats['runs'] += 1
+            stats['failures'] += 0 if ok else 1
+            stats['total'] += duration
+            stats['max'] = max(stats['max'], duration)
+
+    def snapshot(self):
+        """Return {name: {runs, failures, total, max, mean}}."""
+        with self._lock:
+            return {
+                name: {**stats, 'mean': stats['total'] / stats['runs']}
+                for name, stats in sorted(self._stats.items())
+            }
+
+
+class Worker:
+    """
+    Run queued jobs until stopped.
+
+    Args:
+        concurrency: Number of worker threads.
+        poll_interval: Seconds an idle thread waits before polling again.
+        periodic: {job name: seconds between runs}; defaults to settings.JOB_PERIODIC.
+    """
+
+    def __init__(self, concurrency=1, poll_interval=1.0, periodic=None):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.periodic = periodic if periodic is not None else getattr(settings, 'JOB_PERIODIC', {})
+        self.stale_after = getattr(settings, 'JOB_STALE_AFTER', DEFAULT_STALE_AFTER)
+        self.heartbeat_interval = self.stale_after.total_seconds() / 3
+        self.retention = getattr(settings, 'JOB_RETENTION', DEFAULT_RETENTION)
+        self.worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        self.metrics = JobMetrics()
+        self.stop_event = threading.Event()
+        self._next_periodic = {}
+        self._next_prune = None
+        self._running = {}
+        self._running_lock = threading.Lock()
+
+    def run_job(self, job):
+        """Run one claimed job and record its outcome."""
+        start = time.perf_counter()
+        try:
+            with query_source(f'job:{job.name}'):
+                get_handler(job.name)(job.payload)
+        except Exception:
+            duration = time.perf_counter() - start
+            queue.mark_failed(job, duration, traceback.format_exc())
+            self.metrics.record(job.name, duration, ok=False)
+            logger.exception('Job %s #%s failed (attempt %s/%s) after %.3fs',
+                             job.name, job.pk, job.attempts, job.max_attempts, duration)
+            return False
+        duration = time.perf_counter() - start
+        queue.mark_succeeded(job, duration)
+        self.metrics.record(job.name, duration, ok=True)
+        logger.info('Job %s #%s succeeded in %.3fs', job.name, job.pk, duration)
+        return True
+
+    def run_pending(self, thread_id=0):
+        """Claim and run jobs until the queue has nothing runnable."""
+        processed = 0
+        while not self.stop_event.is_set():
+            job = queue.claim(f'{self.worker_id}/{thread_id}')
+            if job is None:
+                break
+            with self._running_lock:
+                self._running[thread_id] = job.pk
+            try:
+                self.run_job(job)
+            finally:
+                with self._running_lock:
+                    self._running.pop(thread_id, None)
+            processed += 1
+        return processed
+
+    def maintain(self, now=None):
+        """Enqueue due periodic jobs, requeue stale running ones and prune old ones."""
+        now = now or timezone.now()
+        for name, interval in self.periodic.items():
+            if name not in self._next_periodic:
+                self._next_periodic[name] = self._resume_periodic(name, interval, now)
+            if now >= self._next_periodic[name]:
+                queue.enqueue_unique(name)
+                self._next_periodic[name] = now + timedelta(seconds=interval)
+        requeued, failed = queue.requeue_stale(self.stale_after, now)
+        if requeued or failed:
+            logger.warning('Requeued %s and failed %s stale jobs', requeued, failed)
+        if self._next_prune is None or now >= self._next_prune:
+            for status, older_than in self.retention.items():
+                pruned = queue.prune_finished(status, older_than, now)
+                if pruned:
+                    logger.info('Pruned %s %s jobs', pruned, status)
+            self._next_prune = now + PRUNE_INTERVAL
+
+    def _resume_periodic(self, name, interval, now):
+        """
+        Return when `name` is next due, from its newest job in the table.
+
+        Keeps the schedule across restarts and `run_worker --burst` runs
+        instead of enqueueing every periodic job on startup.
+        """
+        last = Job.objects.filter(name=name).order_by('-created_at').values_list('created_at', flat=True).first()
+        return last + timedelta(seconds=interval) if last else now
+
+    def heartbeat(self, now=None):
+        """Refresh locked_at on the jobs this worker is running."""
+        with self._running_lock:
+            job_ids = list(self._running.values())
+        return queue.heartbeat(job_ids, now)
+
+    def _loop(self, thread_id):
+        backoff = self.poll_interval
+        try:
+            while not self.stop_event.is_set():
+                close_old_connections()
+                try:
+                    if thread_id == 0:
+                        self.maintain()
+                    processed = self.run_pending(thread_id)
+                except Exception:
+                    logger.exception('Worker thread %s failed; retrying in %.1fs', thread_id, backoff)
+                    # Discard the connection if the error left it unusable.
+                    close_old_connections()
+                    self.stop_event.wait(backoff)
+                    backoff = min(backoff * 2, MAX_ERROR_BACKOFF)
+                    continue
+                backoff = self.poll_interval
+                if not processed:
+                    self.stop_event.wait(self.poll_interval)
+        finally:
+            connection.close()
+
+    def _heartbeat_loop(self):
+        try:
+            while not self.stop_event.wait(self.heartbeat_interval):
+                close_old_connections()
+                try:
+                    self.heartbeat()
+                except Exception:
+                    logger.exception('Job heartbeat failed')
+        finally:
+            connection.close()
+
+    def run(self):
+        """Start the worker threads and block until stop_event is set."""
+        threads = [
+            threading.Thread(target=self._loop, args=(i,), name=f'job-worker-{i}', daemon=True)
+            for i in range(self.concurrency)
+        ]
+        threads.append(threading.Thread(target=self._heartbeat_loop, name='job-heartbeat', daemon=True))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
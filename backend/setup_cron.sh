@@ -7,6 +7,10 @@
 echo "TaskCloud - Cron Job Setup for Auto-Delete Tasks"
 echo "================================================"
 echo ""
+echo "NOTE: the 'worker' docker-compose service already runs expiry and stats"
+echo "reconciliation periodically (JOB_PERIODIC in settings). Host cron is only"
+echo "needed if you do not run the worker."
+echo ""
 echo "To set up automatic deletion of tasks older than 1 hour,"
 echo "follow these steps:"
 echo ""
@@ -19,6 +23,9 @@ echo ""
 echo "3. Add this line to run cleanup every 10 minutes:"
 echo "   */10 * * * * cd /home/ansmn/apps/TaskCloud/backend && docker-compose exec -T taskcloud python manage.py cleanup_expired_tasks >> /home/ansmn/apps/TaskCloud/logs/cleanup.log 2>&1"
 echo ""
+echo "   Optionally, refresh task statistics counters every 5 minutes:"
+echo "   */5 * * * * cd /home/ansmn/apps/TaskCloud/backend && docker-compose exec -T taskcloud python manage.py reconcile_task_stats >> /home/ansmn/apps/TaskCloud/logs/stats.log 2>&1"
+echo ""
 echo "4. Create logs directory if it doesn't exist:"
 echo "   mkdir -p /home/ansmn/apps/TaskCloud/logs"
 echo ""
@@ -1,6 +1,9 @@
 """
 ASGI config for taskcloud project.
 
+/api/ and /health/ requests are dispatched through a lean middleware chain
+(see taskcloud/dispatch.py).
+
 It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
@@ -9,7 +12,7 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+from taskcloud.dispatch import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'taskcloud.settings')
 
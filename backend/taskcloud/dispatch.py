@@ -0,0 +1,95 @@
+"""
+Path-based dispatch between a full and a lean middleware chain.
+
+Django builds one middleware chain per handler, so every request normally
+pays for sessions, CSRF, messages, auth and clickjacking protection. The
+JSON API and the health check use none of these. The dispatchers here
+hold two handlers built from different middleware lists and pick one per
+request by URL prefix:
+
+- paths starting with an entry in settings.LEAN_MIDDLEWARE_PATHS use
+  settings.LEAN_MIDDLEWARE
+- everything else (e.g. /admin/) uses the full settings.MIDDLEWARE
+
+An empty LEAN_MIDDLEWARE_PATHS disables dispatch and returns the plain
+Django handler.
+"""
+from contextlib import contextmanager
+
+from django.conf import settings
+
+
+@contextmanager
+def _middleware(middleware):
+    """Temporarily swap settings.MIDDLEWARE while a handler loads it."""
+    original = settings.MIDDLEWARE
+    settings.MIDDLEWARE = list(middleware)
+    try:
+        yield
+    finally:
+        settings.MIDDLEWARE = original
+
+
+def build_handler(handler_class, middleware):
+    """Instantiate a Django handler whose chain uses `middleware`."""
+    with _middleware(middleware):
+        return handler_class()
+
+
+class WSGIPathDispatcher:
+    """WSGI application routing lean path prefixes to a minimal chain."""
+
+    def __init__(self, full_app, lean_app, prefixes):
+        self.full_app = full_app
+        self.lean_app = lean_app
+        self.prefixes = tuple(prefixes)
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        app = self.lean_app if path.startswith(self.prefixes) else self.full_app
+        return app(environ, start_response)
+
+
+class ASGIPathDispatcher:
+    """ASGI application routing lean path prefixes to a minimal chain."""
+
+    def __init__(self, full_app, lean_app, prefixes):
+        self.full_app = full_app
+        self.lean_app = lean_app
+        self.prefixes = tuple(prefixes)
+
+    async def __call__(self, scope, receive, send):
+        app = self.full_app
+        if scope['type'] == 'http':
+            path = scope['path'].removeprefix(scope.get('root_path', '') or '')
+            if path.startswith(self.prefixes):
+                app = self.lean_app
+        await app(scope, receive, send)
+
+
+def get_wsgi_application():
+    """Like django.core.wsgi.get_wsgi_application, with lean dispatch."""
+    import django
+    from django.core.handlers.wsgi import WSGIHandler
+
+    django.setup(set_prefix=False)
+    full_app = WSGIHandler()
+    prefixes = getattr(settings, 'LEAN_MIDDLEWARE_PATHS', [])
+    if not prefixes:
+        return full_app
+    lean_app = build_handler(WSGIHandler, settings.LEAN_MIDDLEWARE)
+    return WSGIPathDispatcher(full_app, lean_app, prefixes)
+
+
+def get_asgi_application():
+    """Like django.core.asgi.get_asgi_application, with lean dispatch."""
+    import django
+    from django.core.handlers.asgi import ASGIHandler
+
+    django.setup(set_prefix=False)
+    full_app = ASGIHandler()
+    prefixes = getattr(settings, 'LEAN_MIDDLEWARE_PATHS', [])
+    if not prefixes:
+        return full_app
+    lean_app = build_handler(ASGIHandler, settings.LEAN_MIDDLEWARE)
+    return ASGIPathDispatcher(full_app, lean_app, prefixes)
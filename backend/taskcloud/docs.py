@@ -0,0 +1,42 @@
+"""
+API documentation views (OpenAPI schema, Swagger UI, ReDoc).
+
+Kept out of taskcloud.urls so drf_spectacular and its schema generator
+are only imported when a docs URL is first requested (see _lazy_view in
+taskcloud/urls.py), not by every worker and management command.
+"""
+from drf_spectacular.views import (
+    SpectacularAPIView,
+    SpectacularSwaggerView,
+    SpectacularRedocView,
+)
+
+
+class ThrottledSchemaView(SpectacularAPIView):
+    """Schema view with scoped throttling to reduce abuse."""
+    throttle_scope = 'schema'
+
+
+class ThrottledSwaggerView(SpectacularSwaggerView):
+    """Swagger UI view with scoped throttling to reduce abuse."""
+    throttle_scope = 'docs'
+    
+    def get(self, request, *args, **kwargs):
+        """Point the UI to a path-relative schema URL.
+
+        Using a relative path like "../schema/" makes the browser resolve it
+        correctly whether the app is mounted at the domain root ("/api/docs/")
+        or under a proxy prefix (e.g., "/tasks/api/docs/").
+        """
+        self.url = '../schema/'
+        return super().get(request, *args, **kwargs)
+
+
+class ThrottledRedocView(SpectacularRedocView):
+    """ReDoc view with scoped throttling to reduce abuse."""
+    throttle_scope = 'docs'
+    
+    def get(self, request, *args, **kwargs):
+        """Use a path-relative schema URL so reverse proxy prefixes are honored."""
+        self.url = '../schema/'
+        return super().get(request, *args, **kwargs)
@@ -1,18 +1,181 @@
 """
-Health check view for reverse proxy monitoring.
+Health and readiness views for reverse proxy monitoring.
+
+- /health/ (liveness): answers as soon as the process can serve a request;
+  touches nothing, so it is safe to poll as often as the proxy likes.
+- /ready/ (readiness): probes the dependencies a request needs (every
+  configured database, shared caches, and the job queue table when the
+  jobs app is installed) and returns 503 if any of them fails.
+
+Readiness results are cached per process for READINESS_CACHE_TTL seconds
+and probes never run concurrently within a process, so however often the
+load balancer polls, each worker sends at most one `SELECT 1` per TTL.
+Callers never wait for another caller's probe (which a hung database or
+cache could stall indefinitely): they get the previous result while it is
+at most STALE_GRACE seconds past its TTL, then 503 until the probe returns.
+Postgres connections also get a connect_timeout (see settings).
 """
+import threading
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connections
 from django.http import JsonResponse
+from django.utils import timezone
 from django.views.decorators.http import require_GET
 from django.views.decorators.csrf import csrf_exempt
 
+DEFAULT_CACHE_TTL = 2.0
+STALE_GRACE = 5.0
+# In-process caches are always "up"; probing them would prove nothing.
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+_lock = threading.Lock()
+_cached = None  # (expires_at, result)
+
 
 @csrf_exempt
 @require_GET
 def health_check(request):
     """
     Simple health check endpoint for Caddy/load balancer monitoring.
-    
+
     Returns:
         200 OK with status=healthy
     """
     return JsonResponse({'status': 'healthy'}, status=200)
+
+
+def _timed(probe, *args):
+    """Run a probe; return its details plus ok and latency_ms."""
+    start = time.perf_counter()
+    try:
+        details = probe(*args) or {}
+        ok = True
+    except Exception as exc:
+        # Class name only: /ready/ is public and messages can leak hosts.
+        details, ok = {'error': type(exc).__name__}, False
+    return {'ok': ok, 'latency_ms': round((time.perf_counter() - start) * 1000, 2), **details}
+
+
+def pool_stats(connection):
+    """Return connection pool usage for a database, or None if unpooled."""
+    pool = getattr(connection, 'pool', None)  # Postgres with OPTIONS['pool']
+    if pool is None:
+        return None
+    stats = pool.get_stats()
+    in_use = stats.get('pool_size', 0) - stats.get('pool_available', 0)
+    return {
+        'size': stats.get('pool_size', 0),
+        'max': pool.max_size,
+        'in_use': in_use,
+        'waiting': stats.get('requests_waiting', 0),
+        'saturation': round(in_use / pool.max_size, 2) if pool.max_size else None,
+    }
+
+
+def probe_database(alias):
+    connection = connections[alias]
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+    return {'pool': pool_stats(connection)}
+
+
+def probe_cache(alias):
+    cache = caches[alias]
+    key = f'taskcloud:ready:{alias}'
+    cache.set(key, 1, timeout=10)
+    if cache.get(key) != 1:
+        raise RuntimeError('cache read-back failed')
+
+
+def probe_queue():
+    from jobs.models import Job
+
+    oldest = (
+        Job.objects.filter(status=Job.Status.QUEUED, run_at__lte=timezone.now())
+        .order_by('run_at').values_list('run_at', flat=True).first()
+    )
+    lag = (timezone.now() - oldest).total_seconds() if oldest else 0.0
+    return {'lag_seconds': round(lag, 1)}
+
+
+def run_probes(databases_only=False):
+    """
+    Probe every configured dependency; return the readiness result.
+
+    With databases_only, only the database connections are probed; the
+    cache and queue probes need tables that exist only after `migrate`.
+    """
+    checks = {f'database:{alias}': _timed(probe_database, alias) for alias in connections}
+    if databases_only:
+        return _result(checks)
+    for alias, config in settings.CACHES.items():
+        if config.get('BACKEND') not in LOCAL_CACHE_BACKENDS:
+            checks[f'cache:{alias}'] = _timed(probe_cache, alias)
+    if apps.is_installed('jobs'):
+        checks['queue'] = _timed(probe_queue)
+    return _result(checks)
+
+
+def _result(checks):
+    ready = all(check['ok'] for check in checks.values())
+    return {'status': 'ready' if ready else 'unavailable', 'checks': checks, 'checked_at': time.time()}
+
+
+def readiness(force=False):
+    """
+    Return the cached readiness result, probing again once it expires.
+
+    Only one thread probes at a time; the others answer from the previous
+    result (or unavailable) instead of queueing behind it. `force` probes
+    now, waiting for any probe in flight.
+    """
+    global _cached
+    ttl = getattr(settings, 'READINESS_CACHE_TTL', DEFAULT_CACHE_TTL)
+    cached = _cached
+    if not force and cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    if not _lock.acquire(blocking=force):
+        if cached is not None and time.monotonic() < cached[0] + STALE_GRACE:
+            return cached[1]
+        return {
+            'status': 'unavailable',
+            'checks': {'probes': {'ok': False, 'latency_ms': None, 'error': 'ProbeInProgress'}},
+            'checked_at': time.time(),
+        }
+    try:
+        result = run_probes()
+        _cached = (time.monotonic() + ttl, result)
+    finally:
+        _lock.release()
+    return result
+
+
+def reset_readiness():
+    """Forget the cached result (tests and management commands)."""
+    global _cached
+    _cached = None
+
+
+@csrf_exempt
+@require_GET
+def readiness_check(request):
+    """
+    Readiness endpoint for the load balancer.
+
+    Returns:
+        200 with status=ready, or 503 with status=unavailable; both with
+        per-dependency ok/latency_ms (and pool usage for databases) and
+        age_ms, how old the cached result is.
+    """
+    result = readiness()
+    body = {**result, 'age_ms': round((time.time() - result['checked_at']) * 1000)}
+    del body['checked_at']
+    return JsonResponse(body, status=200 if result['status'] == 'ready' else 503)
@@ -0,0 +1,172 @@
+"""
+On-demand request profiling.
+
+ProfilingMiddleware runs a request under cProfile, plus a stack sampler
+for flamegraphs, when either:
+- it is the Nth request this process has seen (PROFILING_SAMPLE_EVERY), or
+- it carries the PROFILING_HEADER header with a value equal to PROFILING_TOKEN.
+
+Each profiled request writes two files to PROFILING_DIR:
+- `<id>.prof`: pstats data (load with `pstats.Stats` or snakeviz)
+- `<id>.collapsed`: sampled collapsed stacks, one `a;b;c <microseconds>`
+  per line, ready for flamegraph.pl or speedscope
+
+The directory is a ring: only the newest PROFILING_MAX_FILES profiles are
+kept. Summarize them with `python manage.py profile_report`.
+
+When PROFILING_ENABLED is false the middleware removes itself at startup
+(MiddlewareNotUsed), so it costs nothing.
+"""
+import hmac
+import itertools
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SUFFIX = '.prof'
+COLLAPSED_SUFFIX = '.collapsed'
+
+
+def profile_dir():
+    return Path(getattr(settings, 'PROFILING_DIR', settings.BASE_DIR / 'profiles'))
+
+
+def list_profiles(directory=None):
+    """Return saved .prof paths, oldest first."""
+    directory = Path(directory) if directory else profile_dir()
+    if not directory.is_dir():
+        return []
+    return sorted(directory.glob(f'*{PROFILE_SUFFIX}'))
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+
+class StackSampler:
+    """
+    Sample one thread's Python stack at a fixed interval.
+
+    cProfile only records caller/callee pairs, so full call stacks for the
+    flamegraph output come from this sampler running alongside it.
+    """
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                key = ';'.join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self):
+        """Return `a;b;c <microseconds>` lines, heaviest first."""
+        weight = self.interval * 1e6
+        return [
+            f'{stack} {round(count * weight)}'
+            for stack, count in sorted(self.counts.items(), key=lambda item: -item[1])
+        ]
+
+
+class ProfilingMiddleware:
+    """Profile sampled or explicitly requested requests with cProfile."""
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_every = getattr(settings, 'PROFILING_SAMPLE_EVERY', 0)
+        self.header = getattr(settings, 'PROFILING_HEADER', 'X-TaskCloud-Profile')
+        self.token = getattr(settings, 'PROFILING_TOKEN', '')
+        self.max_files = getattr(settings, 'PROFILING_MAX_FILES', 50)
+        self.sample_interval = getattr(settings, 'PROFILING_SAMPLE_INTERVAL', 0.001)
+        self.directory = profile_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._counter = itertools.count(1)
+
+    def should_profile(self, request):
+        if self.token:
+            supplied = request.headers.get(self.header, '')
+            if supplied and hmac.compare_digest(supplied, self.token):
+                return True
+        return bool(self.sample_every) and next(self._counter) % self.sample_every == 0
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        # Imported here: cProfile/pstats are only needed once profiling
+        # is enabled, not by every worker that loads the middleware.
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is active on this interpreter (e.g. a
+            # concurrent profiled request in a threaded worker).
+            return self.get_response(request)
+        sampler = StackSampler(threading.get_ident(), self.sample_interval)
+        sampler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+            sampler.stop()
+
+        profile_id = self.save(profiler, sampler, request)
+        if profile_id:
+            response['X-Profile-Id'] = profile_id
+        return response
+
+    def save(self, profiler, sampler, request):
+        """Write .prof and .collapsed files, then trim the ring."""
+        import pstats
+
+        slug = re.sub(r'[^A-Za-z0-9]+', '-', request.path).strip('-') or 'root'
+        profile_id = f'{time.time_ns() // 1000}-{os.getpid()}-{request.method}-{slug}'[:150]
+        try:
+            stats = pstats.Stats(profiler)
+            stats.dump_stats(self.directory / f'{profile_id}{PROFILE_SUFFIX}')
+            (self.directory / f'{profile_id}{COLLAPSED_SUFFIX}').write_text(
+                '\n'.join(sampler.collapsed()) + '\n'
+            )
+            self.trim()
+        except OSError:
+            logger.exception('Could not save request profile %s', profile_id)
+            return None
+        return profile_id
+
+    def trim(self):
+        """Delete the oldest profiles beyond max_files."""
+        profiles = list_profiles(self.directory)
+        for path in profiles[:max(len(profiles) - self.max_files, 0)]:
+            path.unlink(missing_ok=True)
+            path.with_suffix(COLLAPSED_SUFFIX).unlink(missing_ok=True)
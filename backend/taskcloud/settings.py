@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+from datetime import timedelta
 from pathlib import Path
 import os
 
@@ -43,7 +44,8 @@ SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 # Application definition
 
 INSTALLED_APPS = [
-    'django.contrib.admin',
+    # Admin modules are autodiscovered by taskcloud.urls, not at startup
+    'django.contrib.admin.apps.SimpleAdminConfig',
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
@@ -55,9 +57,12 @@ INSTALLED_APPS = [
     'corsheaders',
     # Local apps
     'tasks',
+    'jobs',
 ]
 
 MIDDLEWARE = [
+    'taskcloud.profiling.ProfilingMiddleware',
+    'taskcloud.slow_queries.QuerySourceMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -68,6 +73,41 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Lean middleware chain for the JSON API and health routes. Requests whose
+# path starts with one of LEAN_MIDDLEWARE_PATHS skip sessions, CSRF,
+# messages, auth and clickjacking (see taskcloud/dispatch.py); /admin/ keeps
+# the full MIDDLEWARE stack. Set DJANGO_LEAN_MIDDLEWARE_PATHS='' to disable.
+LEAN_MIDDLEWARE_PATHS = [
+    p for p in os.environ.get('DJANGO_LEAN_MIDDLEWARE_PATHS', '/api/,/health/,/ready/').split(',') if p
+]
+
+LEAN_MIDDLEWARE = [
+    'taskcloud.profiling.ProfilingMiddleware',
+    'taskcloud.slow_queries.QuerySourceMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+# On-demand request profiling (see taskcloud/profiling.py). Disabled by
+# default; when enabled, profiles every Nth request and any request sending
+# PROFILING_HEADER with the PROFILING_TOKEN value.
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'false').lower() == 'true'
+PROFILING_SAMPLE_EVERY = int(os.environ.get('PROFILING_SAMPLE_EVERY', '0'))
+PROFILING_HEADER = 'X-TaskCloud-Profile'
+PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN', '')
+PROFILING_DIR = Path(os.environ.get('PROFILING_DIR', BASE_DIR / 'profiles'))
+PROFILING_MAX_FILES = int(os.environ.get('PROFILING_MAX_FILES', '50'))
+PROFILING_SAMPLE_INTERVAL = 0.001  # stack sampler period (seconds) for .collapsed output
+
+# Slow-query log (see taskcloud/slow_queries.py and `slow_queries`). Queries
+# at or above the threshold are logged with their EXPLAIN plan; set
+# SLOW_QUERY_THRESHOLD_MS='' to disable.
+_slow_query_threshold = os.environ.get('SLOW_QUERY_THRESHOLD_MS', '200')
+SLOW_QUERY_THRESHOLD_MS = float(_slow_query_threshold) if _slow_query_threshold else None
+SLOW_QUERY_LOG = Path(os.environ.get('SLOW_QUERY_LOG', BASE_DIR / 'logs' / 'slow_queries.jsonl'))
+SLOW_QUERY_LOG_MAX_BYTES = 10 * 1024 * 1024
+
 ROOT_URLCONF = 'taskcloud.urls'
 
 TEMPLATES = [
@@ -104,6 +144,12 @@ if db_url:
     try:
         import dj_database_url  # type: ignore
         DATABASES['default'] = dj_database_url.parse(db_url, conn_max_age=600, ssl_require=False)
+        if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+            # Fail fast instead of hanging requests and /ready/ probes on an
+            # unreachable server.
+            DATABASES['default'].setdefault('OPTIONS', {}).setdefault(
+                'connect_timeout', int(os.environ.get('DB_CONNECT_TIMEOUT_SECONDS', '5'))
+            )
     except Exception:
         # Fall back to default SQLite if parsing fails
         pass
@@ -151,22 +197,89 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# REST Framework throttling. Set DJANGO_THROTTLE_ANON / DJANGO_THROTTLE_USER
+# to '' to drop that throttle entirely (e.g. when the proxy rate-limits);
+# disabled throttles are never imported, instantiated or consulted.
+THROTTLE_RATES = {
+    'anon': os.environ.get('DJANGO_THROTTLE_ANON', '100/min'),
+    'user': os.environ.get('DJANGO_THROTTLE_USER', '1000/min'),
+    'docs': '10/min',
+    'schema': '20/min',
+    'bulk': '10/min',
+}
+THROTTLE_CLASSES = [
+    'rest_framework.throttling.ScopedRateThrottle',
+    *(['rest_framework.throttling.AnonRateThrottle'] if THROTTLE_RATES['anon'] else []),
+    *(['rest_framework.throttling.UserRateThrottle'] if THROTTLE_RATES['user'] else []),
+]
+
 # REST Framework configuration
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
-    'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.ScopedRateThrottle',
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle',
+    'DEFAULT_THROTTLE_CLASSES': THROTTLE_CLASSES,
+    'DEFAULT_THROTTLE_RATES': THROTTLE_RATES,
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
-    'DEFAULT_THROTTLE_RATES': {
-        'anon': '100/min',
-        'user': '1000/min',
-        'docs': '10/min',
-        'schema': '20/min',
-    },
 }
 
+# Optional: MessagePack wire format (Accept / Content-Type: application/msgpack)
+try:
+    import msgpack  # type: ignore  # noqa: F401
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append('tasks.renderers.MessagePackRenderer')
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].append('tasks.parsers.MessagePackParser')
+except ImportError:
+    pass
+
+# Window for the "due soon" count in GET /api/tasks/stats/
+TASK_STATS_DUE_SOON = timedelta(hours=int(os.environ.get('TASK_STATS_DUE_SOON_HOURS', '24')))
+# GET /api/tasks/stats/ reconciles first when the overdue/due-soon snapshot is older than this
+TASK_STATS_MAX_AGE = timedelta(seconds=int(os.environ.get('TASK_STATS_MAX_AGE_SECONDS', '600')))
+
+# Maximum NDJSON lines accepted per POST /api/tasks/import/ (the
+# `import_tasks` command has no limit)
+TASK_IMPORT_API_MAX_ROWS = int(os.environ.get('TASK_IMPORT_API_MAX_ROWS', '10000'))
+# Request body and per-line size limits for POST /api/tasks/import/
+TASK_IMPORT_API_MAX_BYTES = int(os.environ.get('TASK_IMPORT_API_MAX_BYTES', str(16 * 1024 * 1024)))
+TASK_IMPORT_API_MAX_LINE_BYTES = int(os.environ.get('TASK_IMPORT_API_MAX_LINE_BYTES', str(64 * 1024)))
+
+# Admin changelist: above this many rows (Postgres planner estimate) the
+# task count shown is the estimate instead of an exact COUNT(*)
+TASK_ADMIN_EXACT_COUNT_LIMIT = int(os.environ.get('TASK_ADMIN_EXACT_COUNT_LIMIT', '10000'))
+
+# Due-date reminders (see tasks/reminders.py and `run_reminder_scheduler`)
+TASK_REMINDER_WINDOW = timedelta(seconds=int(os.environ.get('TASK_REMINDER_WINDOW_SECONDS', '60')))
+TASK_REMINDER_LEAD = timedelta(minutes=int(os.environ.get('TASK_REMINDER_LEAD_MINUTES', '0')))
+TASK_REMINDER_SINKS = [
+    p for p in os.environ.get('TASK_REMINDER_SINKS', 'tasks.reminders.LogReminderSink').split(',') if p
+]
+TASK_REMINDER_WEBHOOK_URL = os.environ.get('TASK_REMINDER_WEBHOOK_URL', '')
+
+# Background job queue (see jobs/ and `run_worker`)
+JOB_RETRY_BACKOFF = timedelta(seconds=int(os.environ.get('JOB_RETRY_BACKOFF_SECONDS', '10')))
+JOB_RETRY_MAX_BACKOFF = timedelta(hours=1)
+JOB_STALE_AFTER = timedelta(minutes=int(os.environ.get('JOB_STALE_AFTER_MINUTES', '15')))
+# Finished jobs older than this are deleted, per status.
+JOB_RETENTION = {
+    'succeeded': timedelta(days=int(os.environ.get('JOB_SUCCEEDED_RETENTION_DAYS', '7'))),
+    'failed': timedelta(days=int(os.environ.get('JOB_FAILED_RETENTION_DAYS', '30'))),
+}
+# Periodic jobs enqueued by workers: {job name: interval in seconds}
+JOB_PERIODIC = {
+    'tasks.cleanup_expired': 600,
+    'tasks.reconcile_stats': 300,
+}
+
+# GET /ready/ probe results are reused for this many seconds per process
+# (see taskcloud/health.py)
+READINESS_CACHE_TTL = float(os.environ.get('READINESS_CACHE_TTL_SECONDS', '2'))
+
 # drf-spectacular settings for API documentation
 SPECTACULAR_SETTINGS = {
     'TITLE': 'TaskCloud API',
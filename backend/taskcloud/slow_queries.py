@@ -0,0 +1,187 @@
+"""
+Slow-query log with automatic EXPLAIN capture.
+
+A database execute-wrapper (installed on every connection by
+TasksConfig.ready) times each query. Queries slower than
+SLOW_QUERY_THRESHOLD_MS are appended as JSON lines to SLOW_QUERY_LOG with:
+
+- fingerprint: hash of the SQL with literals and IN-lists normalized
+- source: the view, management command or job that issued it
+- explain: the query plan (Postgres `EXPLAIN (FORMAT JSON)`, SQLite
+  `EXPLAIN QUERY PLAN`), captured once per fingerprint per process
+
+The log is rotated to `<name>.1` at SLOW_QUERY_LOG_MAX_BYTES. Aggregate it
+with `python manage.py slow_queries`.
+"""
+import contextvars
+import hashlib
+import json
+import logging
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_source = contextvars.ContextVar('slow_query_source', default=None)
+_in_wrapper = contextvars.ContextVar('slow_query_in_wrapper', default=False)
+_explained = set()
+_write_lock = threading.Lock()
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PARAM_LIST = re.compile(r'\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)')
+_SPACE = re.compile(r'\s+')
+_EXPLAINABLE = ('SELECT', 'WITH', 'UPDATE', 'DELETE')
+
+
+def normalize(sql):
+    """Reduce SQL to a shape shared by all executions of the same query."""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = sql.replace('%s', '?')
+    sql = _PARAM_LIST.sub('(...)', sql)
+    return _SPACE.sub(' ', sql).strip()
+
+
+def fingerprint(sql):
+    return hashlib.sha1(normalize(sql).encode()).hexdigest()[:16]
+
+
+def current_source():
+    """Return what is issuing queries: a view, job, or management command."""
+    source = _source.get()
+    if source:
+        return source
+    argv = sys.argv
+    if len(argv) > 1 and argv[0].endswith('manage.py'):
+        return f'command:{argv[1]}'
+    return 'unknown'
+
+
+@contextmanager
+def query_source(name):
+    """Attribute queries issued inside the block to `name`."""
+    token = _source.set(name)
+    try:
+        yield
+    finally:
+        _source.reset(token)
+
+
+def log_path():
+    return Path(getattr(settings, 'SLOW_QUERY_LOG', settings.BASE_DIR / 'logs' / 'slow_queries.jsonl'))
+
+
+def explain(connection, sql, params):
+    """Return the query plan for `sql`, or None if unsupported or failed."""
+    vendor = connection.vendor
+    if vendor == 'postgresql':
+        prefix = 'EXPLAIN (FORMAT JSON) '
+    elif vendor == 'sqlite':
+        prefix = 'EXPLAIN QUERY PLAN '
+    else:
+        return None
+    try:
+        # Savepoint so a failed EXPLAIN cannot abort the caller's transaction.
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(prefix + sql, params)
+                rows = cursor.fetchall()
+    except Exception:
+        logger.debug('EXPLAIN failed for slow query', exc_info=True)
+        return None
+    if vendor == 'postgresql':
+        plan = rows[0][0]
+        return json.loads(plan) if isinstance(plan, str) else plan
+    return [row[-1] for row in rows]
+
+
+def _write(entry):
+    path = log_path()
+    max_bytes = getattr(settings, 'SLOW_QUERY_LOG_MAX_BYTES', 10 * 1024 * 1024)
+    line = json.dumps(entry, default=str) + '\n'
+    with _write_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size + len(line) > max_bytes:
+            path.replace(path.with_name(path.name + '.1'))
+        with path.open('a') as handle:
+            handle.write(line)
+
+
+def record(connection, sql, params, many, duration):
+    """Log one slow query, capturing its plan the first time it is seen."""
+    key = fingerprint(sql)
+    entry = {
+        'at': timezone.now().isoformat(),
+        'fingerprint': key,
+        'sql': sql,
+        'duration_ms': round(duration * 1000, 3),
+        'source': current_source(),
+        'vendor': connection.vendor,
+    }
+    if not many and key not in _explained and sql.lstrip().upper().startswith(_EXPLAINABLE):
+        _explained.add(key)
+        entry['explain'] = explain(connection, sql, params)
+    logger.warning('Slow query (%.1fms) from %s: %s', entry['duration_ms'], entry['source'], normalize(sql))
+    try:
+        _write(entry)
+    except OSError:
+        logger.exception('Could not write slow query log')
+
+
+def slow_query_wrapper(execute, sql, params, many, context):
+    """Execute-wrapper timing queries and recording the slow ones."""
+    threshold = getattr(settings, 'SLOW_QUERY_THRESHOLD_MS', None)
+    if threshold is None or _in_wrapper.get():
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration = time.perf_counter() - start
+    if duration * 1000 >= threshold:
+        token = _in_wrapper.set(True)
+        try:
+            record(context['connection'], sql, params, many, duration)
+        finally:
+            _in_wrapper.reset(token)
+    return result
+
+
+def _install(sender, connection, **kwargs):
+    if slow_query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(slow_query_wrapper)
+
+
+def install():
+    """Install the wrapper on every current and future connection."""
+    from django.db import connections
+    connection_created.connect(_install, dispatch_uid='taskcloud.slow_queries')
+    for connection in connections.all(initialized_only=True):
+        _install(None, connection)
+
+
+class QuerySourceMiddleware:
+    """Attribute queries made while handling a request to its view."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _source.set(f'{request.method} {request.path}')
+        try:
+            return self.get_response(request)
+        finally:
+            _source.reset(token)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        match = request.resolver_match
+        name = match.view_name if match and match.view_name else view_func.__qualname__
+        _source.set(f'view:{name}')
@@ -0,0 +1,112 @@
+"""
+Cold-start measurement for `python manage.py startup_report`.
+
+`measure_startup()` launches a fresh interpreter running this module under
+`python -X importtime`, which times the boot phases every process pays:
+
+- setup: settings and the app registry (`django.setup()`), the whole cost
+  of a short management command before it does any work
+- application: building the WSGI handler and middleware chains
+- first request: the first request through it (URLconf, views, admin
+  registration, DRF settings), what a fresh gunicorn worker adds
+- second request: the same request again, for the steady-state cost
+
+Phase markers written to stderr between the phases attribute every
+`-X importtime` line to the phase that triggered the import.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from io import BytesIO
+from pathlib import Path
+
+PHASES = ['setup', 'application', 'first request', 'second request']
+PHASE_MARKER = 'startup-phase:'
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _request(application, path):
+    from wsgiref.util import setup_testing_defaults
+
+    environ = {'PATH_INFO': path, 'HTTP_HOST': 'localhost', 'HTTP_ACCEPT': 'application/json',
+               'wsgi.input': BytesIO()}
+    setup_testing_defaults(environ)
+    status = []
+    b''.join(application(environ, lambda code, headers, exc_info=None: status.append(code)))
+    return status[0]
+
+
+def _child(path):
+    """Run the boot phases in this (fresh) process; print timings as JSON."""
+    timings = {}
+
+    def phase(name, func):
+        print(f'{PHASE_MARKER} {name}', file=sys.stderr, flush=True)
+        start = time.perf_counter()
+        result = func()
+        timings[name] = time.perf_counter() - start
+        return result
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'taskcloud.settings')
+    import django
+    phase('setup', django.setup)
+    from taskcloud.dispatch import get_wsgi_application
+    application = phase('application', get_wsgi_application)
+    status = phase('first request', lambda: _request(application, path))
+    phase('second request', lambda: _request(application, path))
+    print(json.dumps({'timings': timings, 'status': status}))
+
+
+def parse_importtime(stderr):
+    """
+    Aggregate `-X importtime` output by phase and top-level package.
+
+    Returns:
+        {phase: {package: [modules, self seconds]}}
+    """
+    breakdown = {name: defaultdict(lambda: [0, 0.0]) for name in ['interpreter', *PHASES]}
+    current = 'interpreter'
+    for line in stderr.splitlines():
+        if line.startswith(PHASE_MARKER):
+            current = line[len(PHASE_MARKER):].strip()
+            continue
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        parts = name.split('.')
+        # django.contrib.* apps are reported separately from core Django.
+        package = '.'.join(parts[:3]) if parts[:2] == ['django', 'contrib'] else parts[0]
+        entry = breakdown[current][package]
+        entry[0] += 1
+        entry[1] += int(self_us) / 1e6
+    return {name: dict(packages) for name, packages in breakdown.items()}
+
+
+def measure_startup(path='/health/', env=None):
+    """
+    Boot a fresh interpreter and time it.
+
+    Returns:
+        Dict with `total` (process wall time), `timings` per phase,
+        `status` of the first request and `imports` (see parse_importtime).
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-m', 'taskcloud.startup', path],
+        cwd=BACKEND_DIR, env={**os.environ, **(env or {})}, capture_output=True, text=True,
+    )
+    total = time.perf_counter() - start
+    if completed.returncode != 0:
+        output = [line for line in completed.stderr.splitlines()
+                  if not line.startswith(('import time:', PHASE_MARKER))]
+        raise RuntimeError(output[-1] if output else f'exit status {completed.returncode}')
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {'total': total, **result, 'imports': parse_importtime(completed.stderr)}
+
+
+if __name__ == '__main__':
+    _child(sys.argv[1] if len(sys.argv) > 1 else '/health/')
@@ -16,50 +16,42 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from django.conf import settings
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularSwaggerView,
-    SpectacularRedocView,
-)
-from .health import health_check
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+from .health import health_check, readiness_check
 
+# Admin modules are registered here rather than at app loading
+# (INSTALLED_APPS uses SimpleAdminConfig), so management commands that
+# never load the URLconf skip importing them.
+admin.autodiscover()
 
-class ThrottledSchemaView(SpectacularAPIView):
-    """Schema view with scoped throttling to reduce abuse."""
-    throttle_scope = 'schema'
 
+def _lazy_view(dotted_path, **initkwargs):
+    """
+    Return a view that imports the class-based view at `dotted_path` on
+    its first request.
 
-class ThrottledSwaggerView(SpectacularSwaggerView):
-    """Swagger UI view with scoped throttling to reduce abuse."""
-    throttle_scope = 'docs'
-    
-    def get(self, request, *args, **kwargs):
-        """Point the UI to a path-relative schema URL.
+    Keeps rarely used views (API docs) and their dependencies out of
+    worker startup.
+    """
+    view = None
 
-        Using a relative path like "../schema/" makes the browser resolve it
-        correctly whether the app is mounted at the domain root ("/api/docs/")
-        or under a proxy prefix (e.g., "/tasks/api/docs/").
-        """
-        self.url = '../schema/'
-        return super().get(request, *args, **kwargs)
+    def lazy(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
 
+    return csrf_exempt(lazy)
 
-class ThrottledRedocView(SpectacularRedocView):
-    """ReDoc view with scoped throttling to reduce abuse."""
-    throttle_scope = 'docs'
-    
-    def get(self, request, *args, **kwargs):
-        """Use a path-relative schema URL so reverse proxy prefixes are honored."""
-        self.url = '../schema/'
-        return super().get(request, *args, **kwargs)
 
 urlpatterns = [
     path('health/', health_check, name='health'),
+    path('ready/', readiness_check, name='ready'),
     path('admin/', admin.site.urls),
     path('api/tasks/', include('tasks.urls')),
     # API documentation (available in production with throttling)
-    path('api/schema/', ThrottledSchemaView.as_view(), name='schema'),
-    path('api/docs/', ThrottledSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('api/redoc/', ThrottledRedocView.as_view(url_name='schema'), name='redoc'),
+    path('api/schema/', _lazy_view('taskcloud.docs.ThrottledSchemaView'), name='schema'),
+    path('api/docs/', _lazy_view('taskcloud.docs.ThrottledSwaggerView', url_name='schema'), name='swagger-ui'),
+    path('api/redoc/', _lazy_view('taskcloud.docs.ThrottledRedocView', url_name='schema'), name='redoc'),
 ]
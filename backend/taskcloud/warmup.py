@@ -0,0 +1,45 @@
+"""
+Worker warmup.
+
+Run once in each freshly forked server worker (see gunicorn.conf.py) so
+the first real request does not pay for lazy initialization: URL
+resolver population, view/serializer imports and DRF settings. The
+database connection is opened too only where the calling thread will
+serve requests (gunicorn sync workers); connections are per thread.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+WARMUP_PATHS = ['/health/', '/api/tasks/', '/api/tasks/stats/']
+
+
+def warm_up(connect=True):
+    """
+    Prime per-process caches; returns the seconds spent.
+
+    Args:
+        connect: Also open the default database connection for this thread.
+    """
+    start = time.perf_counter()
+    resolver = get_resolver()
+    for path in WARMUP_PATHS:
+        try:
+            resolver.resolve(path)
+        except Exception:
+            logger.debug('Warmup could not resolve %s', path, exc_info=True)
+    # DRF imports renderer/parser/throttle classes lazily on first access.
+    from rest_framework.settings import api_settings
+    for name in ('DEFAULT_RENDERER_CLASSES', 'DEFAULT_PARSER_CLASSES', 'DEFAULT_THROTTLE_CLASSES'):
+        getattr(api_settings, name)
+    if connect and settings.DATABASES:
+        try:
+            connections['default'].ensure_connection()
+        except Exception:
+            logger.warning('Warmup could not connect to the database', exc_info=True)
+    return time.perf_counter() - start
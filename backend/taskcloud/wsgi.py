@@ -1,6 +1,9 @@
 """
 WSGI config for taskcloud project.
 
+/api/ and /health/ requests are dispatched through a lean middleware chain
+(see taskcloud/dispatch.py).
+
 It exposes the WSGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
@@ -9,7 +12,7 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 
 import os
 
-from django.core.wsgi import get_wsgi_application
+from taskcloud.dispatch import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'taskcloud.settings')
 
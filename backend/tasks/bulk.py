@@ -0,0 +1,251 @@
+"""
+Streaming NDJSON import/export of tasks.
+
+Both directions work in constant memory: export iterates the table with a
+chunked server-side cursor and yields one JSON line per task, and import
+reads, validates and inserts `chunk_size` lines at a time.
+
+Inserts bypass the ORM: on Postgres each chunk is sent with
+`COPY ... FROM STDIN` (CSV), elsewhere with one batched `executemany`.
+Each chunk commits on its own, so a bad chunk (e.g. a duplicate id) is
+reported and skipped without losing the rest of the import.
+
+Used by the `export_tasks` / `import_tasks` commands and the
+/api/tasks/export/ and /api/tasks/import/ endpoints.
+"""
+import io
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.fields import DateTimeField
+
+from . import counters
+from .models import Task
+
+EXPORT_FIELDS = ['id', 'title', 'description', 'created_at', 'due_date', 'is_completed']
+DEFAULT_CHUNK_SIZE = 5000
+TITLE_MAX_LENGTH = Task._meta.get_field('title').max_length
+# Datetimes as the JSON API renders them (ISO 8601, UTC as `Z`).
+_format_datetime = DateTimeField().to_representation
+
+
+def export_lines(queryset=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield one NDJSON line (bytes) per task."""
+    queryset = queryset if queryset is not None else Task.objects.all()
+    rows = queryset.order_by().values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+    dumps = json.JSONEncoder(separators=(',', ':')).encode
+    for task_id, title, description, created_at, due_date, is_completed in rows:
+        yield (dumps({
+            'id': str(task_id),
+            'title': title,
+            'description': description,
+            'created_at': _format_datetime(created_at),
+            'due_date': _format_datetime(due_date),
+            'is_completed': is_completed,
+        }) + '\n').encode()
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import: counts, timing and the first errors."""
+    imported: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    errors: list = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self):
+        return self.imported / self.seconds if self.seconds else 0.0
+
+    def as_dict(self):
+        return {
+            'imported': self.imported,
+            'rejected': self.rejected,
+            'seconds': round(self.seconds, 3),
+            'rows_per_sec': round(self.rows_per_sec),
+            'errors': self.errors,
+        }
+
+
+class RowError(ValueError):
+    """A single NDJSON line failed validation."""
+
+
+def _parse_datetime(value, name):
+    if value is None:
+        return None
+    parsed = parse_datetime(value) if isinstance(value, str) else None
+    if parsed is None:
+        raise RowError(f'{name}: invalid datetime')
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, timezone.get_default_timezone())
+    return parsed
+
+
+def clean_row(data, now, trusted=False):
+    """
+    Validate one decoded line with the same rules as TaskSerializer.
+
+    `id` and `created_at` are read-only there too: they are ignored (a new
+    id, created now) unless `trusted`, as for the `import_tasks` command
+    restoring an export. A client-supplied created_at would otherwise
+    exempt the task from the auto-delete.
+
+    Returns:
+        Tuple of values in EXPORT_FIELDS order.
+    """
+    if not isinstance(data, dict):
+        raise RowError('expected a JSON object')
+    title = data.get('title')
+    # Strings are trimmed like DRF's CharField(trim_whitespace=True).
+    title = title.strip() if isinstance(title, str) else ''
+    if not title:
+        raise RowError('title: this field is required')
+    if len(title) > TITLE_MAX_LENGTH:
+        raise RowError(f'title: ensure this field has no more than {TITLE_MAX_LENGTH} characters')
+    description = data.get('description', '')
+    if not isinstance(description, str):
+        raise RowError('description: expected a string')
+    description = description.strip()
+    is_completed = data.get('is_completed', False)
+    if not isinstance(is_completed, bool):
+        raise RowError('is_completed: expected a boolean')
+    task_id, created_at = uuid.uuid4(), now
+    if trusted:
+        try:
+            task_id = uuid.UUID(data['id']) if data.get('id') else task_id
+        except (TypeError, ValueError, AttributeError):
+            raise RowError('id: invalid UUID') from None
+        created_at = _parse_datetime(data.get('created_at'), 'created_at') or now
+    due_date = _parse_datetime(data.get('due_date'), 'due_date')
+    return (task_id, title, description, created_at, due_date, is_completed)
+
+
+def _csv_field(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy_rows(cursor, rows):
+    """Insert rows with COPY FROM STDIN (Postgres)."""
+    columns = ', '.join(connection.ops.quote_name(name) for name in EXPORT_FIELDS)
+    sql = f'COPY {connection.ops.quote_name(Task._meta.db_table)} ({columns}) FROM STDIN WITH (FORMAT csv)'
+    data = ''.join(','.join(_csv_field(value) for value in row) + '\n' for row in rows)
+    raw = cursor.cursor
+    if hasattr(raw, 'copy_expert'):  # psycopg2
+        raw.copy_expert(sql, io.StringIO(data))
+    else:  # psycopg 3
+        with raw.copy(sql) as copy:
+            copy.write(data)
+
+
+def _executemany_rows(cursor, rows):
+    """Insert rows with one batched executemany (SQLite and others)."""
+    # cursor.db is the concrete connection; the module-level `connection`
+    # proxy costs a thread-local lookup per attribute access.
+    db = cursor.db
+    fields = [Task._meta.get_field(name) for name in EXPORT_FIELDS]
+    columns = ', '.join(db.ops.quote_name(f.column) for f in fields)
+    placeholders = ', '.join(['%s'] * len(fields))
+    sql = f'INSERT INTO {db.ops.quote_name(Task._meta.db_table)} ({columns}) VALUES ({placeholders})'
+    # Strings and booleans are already in database form; only UUIDs and
+    # datetimes need the backend's adaptation.
+    adapt = [
+        i for i, f in enumerate(fields)
+        if f.get_internal_type() not in ('CharField', 'TextField', 'BooleanField')
+    ]
+    prepared = []
+    for row in rows:
+        row = list(row)
+        for i in adapt:
+            row[i] = fields[i].get_db_prep_save(row[i], db)
+        prepared.append(row)
+    cursor.executemany(sql, prepared)
+
+
+def insert_rows(rows):
+    """Insert validated rows in one statement and update the task counters."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            _copy_rows(cursor, rows)
+        else:
+            _executemany_rows(cursor, rows)
+    counters.record_bulk_created(len(rows), sum(1 for row in rows if row[5]))
+
+
+def read_lines(stream, max_line_bytes):
+    """
+    Yield the lines of a binary stream without buffering overlong ones.
+
+    A line longer than `max_line_bytes` is yielded cut to
+    `max_line_bytes + 1` bytes (the rest is skipped), so import_lines
+    rejects it under its own line number.
+    """
+    while line := stream.readline(max_line_bytes + 1):
+        if len(line) > max_line_bytes and not line.endswith(b'\n'):
+            while (rest := stream.readline(max_line_bytes + 1)) and not rest.endswith(b'\n'):
+                pass
+        yield line
+
+
+def import_lines(lines, chunk_size=DEFAULT_CHUNK_SIZE, max_rows=None, max_errors=100,
+                 max_line_bytes=None, trusted=False):
+    """
+    Validate and insert NDJSON lines (str or bytes) chunk by chunk.
+
+    Args:
+        lines: Iterable of NDJSON lines.
+        chunk_size: Rows validated and inserted per statement.
+        max_rows: Stop with an error after this many non-blank lines.
+        max_errors: Keep at most this many error messages in the result.
+        max_line_bytes: Reject lines longer than this.
+        trusted: Keep `id` and `created_at` from the input (see clean_row).
+
+    Returns:
+        ImportResult.
+    """
+    result = ImportResult()
+    start = time.perf_counter()
+    now = timezone.now()
+    numbered = ((number, line) for number, line in enumerate(lines, 1) if line.strip())
+    limited = islice(numbered, max_rows) if max_rows is not None else numbered
+
+    def error(message):
+        if len(result.errors) < max_errors:
+            result.errors.append(message)
+
+    while chunk := list(islice(limited, chunk_size)):
+        rows = []
+        for number, line in chunk:
+            try:
+                if max_line_bytes is not None and len(line) > max_line_bytes:
+                    raise RowError(f'line exceeds {max_line_bytes} bytes')
+                rows.append(clean_row(json.loads(line), now, trusted))
+            except ValueError as exc:  # JSONDecodeError and RowError
+                result.rejected += 1
+                error(f'line {number}: {exc}')
+        if rows:
+            try:
+                insert_rows(rows)
+                result.imported += len(rows)
+            except DatabaseError as exc:
+                result.rejected += len(rows)
+                error(f'lines {chunk[0][0]}-{chunk[-1][0]}: {exc}'.strip())
+
+    if max_rows is not None and next(numbered, None) is not None:
+        error(f'import limited to {max_rows} rows; remaining lines ignored')
+    result.seconds = time.perf_counter() - start
+    return result
@@ -0,0 +1,200 @@
+"""
+Admin changelist helpers for large task tables.
+
+The stock changelist runs an exact COUNT(*) on every page load, pages
+with OFFSET, and builds the date drill-down with SELECT DISTINCT over the
+whole table. On millions of rows each of those is a full scan. TaskAdmin
+uses these replacements instead:
+
+- EstimatedCountPaginator: counts from planner statistics (Postgres
+  pg_class.reltuples unfiltered, the EXPLAIN row estimate when filtered;
+  SQLite sqlite_stat1 unfiltered); exact counts below
+  TASK_ADMIN_EXACT_COUNT_LIMIT or when no estimate is available.
+- KeysetChangeList: in the default (-created_at, -id) order, pages with an
+  `?after=<created_at>,<id>` cursor instead of OFFSET, so every page is an
+  index range scan on task_created_id_idx.
+- ChangeListQuerySet: answers the date hierarchy's datetimes() with one
+  indexed MAX() probe per year/month/day bucket (a loose index scan)
+  instead of a DISTINCT over every row, and its MIN/MAX range lookup
+  with one index probe each.
+"""
+import datetime
+import json
+import uuid
+
+from django.conf import settings
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ORDER_VAR, ChangeList
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import Max, Min, Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+
+CURSOR_VAR = 'after'
+DEFAULT_EXACT_COUNT_LIMIT = 10000
+
+
+def estimate_count(queryset):
+    """
+    Return the planner's row estimate for `queryset`, or None.
+
+    Postgres estimates any query (reltuples, or EXPLAIN when filtered);
+    SQLite only the whole table, from sqlite_stat1 once ANALYZE has run.
+    None means "count exactly".
+    """
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    filtered = bool(queryset.query.where)
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql' and not filtered:
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [table])
+            elif connection.vendor == 'postgresql':
+                sql, params = queryset.order_by().query.sql_with_params()
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                return int(plan[0]['Plan']['Plan Rows'])
+            elif connection.vendor == 'sqlite' and not filtered:
+                # Each stat row starts with the table's row count.
+                cursor.execute("SELECT CAST(stat AS INTEGER) FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    # reltuples is -1 (or 0) until the table is first analyzed.
+    return row[0] if row and row[0] > 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator whose count comes from planner statistics on large tables."""
+
+    estimated = False
+
+    @cached_property
+    def count(self):
+        limit = getattr(settings, 'TASK_ADMIN_EXACT_COUNT_LIMIT', DEFAULT_EXACT_COUNT_LIMIT)
+        estimate = estimate_count(self.object_list) if isinstance(self.object_list, QuerySet) else None
+        if estimate is None or estimate < limit:
+            return super().count
+        self.estimated = True
+        return estimate
+
+
+def _truncate(value, kind, tzinfo):
+    value = timezone.localtime(value, tzinfo) if timezone.is_aware(value) else value
+    start = datetime.datetime(
+        value.year,
+        1 if kind == 'year' else value.month,
+        1 if kind in ('year', 'month') else value.day,
+    )
+    return timezone.make_aware(start, tzinfo) if settings.USE_TZ else start
+
+
+class ChangeListQuerySet(QuerySet):
+    """QuerySet whose year/month/day datetimes() use indexed MAX() probes."""
+
+    def aggregate(self, *args, **kwargs):
+        # The date hierarchy asks for MIN() and MAX() in one query; SQLite
+        # only answers a lone MIN() or MAX() from the index.
+        if not args and len(kwargs) > 1 and all(isinstance(agg, (Min, Max)) for agg in kwargs.values()):
+            return {name: super(ChangeListQuerySet, self).aggregate(**{name: agg})[name]
+                    for name, agg in kwargs.items()}
+        return super().aggregate(*args, **kwargs)
+
+    def datetimes(self, field_name, kind, order='ASC', tzinfo=None):
+        if kind not in ('year', 'month', 'day') or '__' in field_name:
+            return super().datetimes(field_name, kind, order, tzinfo)
+        tzinfo = tzinfo or (timezone.get_current_timezone() if settings.USE_TZ else None)
+        queryset = self.order_by()
+        buckets = []
+        latest = queryset.aggregate(latest=Max(field_name))['latest']
+        while latest is not None:
+            start = _truncate(latest, kind, tzinfo)
+            buckets.append(start)
+            latest = queryset.filter(**{f'{field_name}__lt': start}).aggregate(latest=Max(field_name))['latest']
+        return buckets[::-1] if order == 'ASC' else buckets
+
+
+def encode_cursor(task):
+    return f'{task.created_at.isoformat()},{task.pk}'
+
+
+def decode_cursor(value):
+    """Parse an `after` value into (created_at, id); raise ValueError if invalid."""
+    created_at, _, pk = value.rpartition(',')
+    parsed = parse_datetime(created_at)
+    if parsed is None:
+        raise ValueError('invalid cursor timestamp')
+    return parsed, uuid.UUID(pk)
+
+
+class KeysetChangeList(ChangeList):
+    """
+    ChangeList that pages the default ordering with a keyset cursor.
+
+    Any other ordering, or ?all=, falls back to the stock page-number
+    pagination (still with estimated counts).
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        self.cursor = None
+        value = request.GET.get(CURSOR_VAR)
+        if value:
+            try:
+                self.cursor = decode_cursor(value)
+            except ValueError as exc:
+                raise IncorrectLookupParameters(exc) from None
+        super().__init__(request, *args, **kwargs)
+        # Not a lookup: keep it out of the search form's hidden inputs.
+        self.params.pop(CURSOR_VAR, None)
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Changing filters, search or ordering starts again from page one.
+        if not new_params or CURSOR_VAR not in new_params:
+            remove = [*(remove or []), CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters).defer('description')
+        return ChangeListQuerySet(
+            model=queryset.model, query=queryset.query, using=queryset._db, hints=queryset._hints,
+        )
+
+    def _after(self, queryset, created_at, pk):
+        return queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+
+    def get_results(self, request):
+        super().get_results(request)
+        self.estimated_count = getattr(self.paginator, 'estimated', False)
+        self.keyset = ORDER_VAR not in self.params and not self.show_all
+        if self.keyset:
+            queryset = self.queryset
+            if self.cursor:
+                queryset = self._after(queryset, *self.cursor)
+            self.result_list = queryset[:self.list_per_page]
+
+    @cached_property
+    def next_cursor(self):
+        """Cursor for the page after this one, or None on the last page."""
+        rows = list(self.result_list)
+        if len(rows) < self.list_per_page:
+            return None
+        last = rows[-1]
+        if not self._after(self.queryset, last.created_at, last.pk).exists():
+            return None
+        return encode_cursor(last)
+
+    def next_page_url(self):
+        return self.get_query_string({CURSOR_VAR: self.next_cursor})
+
+    def first_page_url(self):
+        return self.get_query_string()
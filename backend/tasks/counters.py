@@ -0,0 +1,130 @@
+"""
+Maintained task counters backing GET /api/tasks/stats/.
+
+Every code path that creates, updates or deletes tasks reports the change
+here, in the same transaction as the write, and the single TaskStats row
+is adjusted with F() expressions so the stats endpoint never has to scan
+the task table. Deltas come from the rows a write actually changed (e.g.
+the count delete() returns), so concurrent deletes of one task count once.
+
+`reconcile()` recomputes all counters with one aggregate() query; the
+`tasks.reconcile_stats` periodic job (settings.JOB_PERIODIC) runs it to
+correct drift (e.g. concurrent toggles of the same task) and to refresh
+the clock-dependent overdue/due-soon snapshot, and get_stats() runs it
+when that snapshot is older than TASK_STATS_MAX_AGE.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from .models import Task, TaskStats
+
+DEFAULT_DUE_SOON = timedelta(hours=24)
+DEFAULT_MAX_AGE = timedelta(minutes=10)
+
+
+def _apply(total=0, completed=0):
+    """Add deltas to the counters row, reconciling if it is missing."""
+    if not total and not completed:
+        return
+    updated = TaskStats.objects.filter(pk=TaskStats.SINGLETON_ID).update(
+        total=F('total') + total,
+        completed=F('completed') + completed,
+    )
+    if not updated:
+        reconcile()
+
+
+def record_created(task):
+    """Count a newly created task."""
+    _apply(total=1, completed=int(task.is_completed))
+
+
+def record_bulk_created(total, completed):
+    """Count a batch of `total` imported tasks, `completed` of them completed."""
+    _apply(total=total, completed=completed)
+
+
+def record_updated(was_completed, task):
+    """Count a completion toggle on an existing task."""
+    _apply(completed=int(task.is_completed) - int(was_completed))
+
+
+def record_deleted(task):
+    """Count a single deleted task."""
+    _apply(total=-1, completed=-int(task.is_completed))
+
+
+def record_bulk_deleted(total, completed):
+    """Count a batch delete of `total` tasks, `completed` of them completed."""
+    _apply(total=-total, completed=-completed)
+
+
+def delete_tasks(queryset):
+    """
+    Delete the tasks in `queryset` and subtract them from the counters.
+
+    Completed and open tasks are deleted separately so the counts come
+    from the rows each DELETE removed, not from an earlier count that
+    concurrent writes may have made stale.
+
+    Returns:
+        (total, completed) tasks deleted.
+    """
+    label = Task._meta.label
+    with transaction.atomic():
+        completed = queryset.filter(is_completed=True).delete()[1].get(label, 0)
+        active = queryset.filter(is_completed=False).delete()[1].get(label, 0)
+        record_bulk_deleted(completed + active, completed)
+    return completed + active, completed
+
+
+def reconcile(now=None, stale_before=None):
+    """
+    Recompute all counters from the task table with one aggregate() query.
+
+    The stats row is locked first so concurrent deltas wait instead of
+    being overwritten by the recomputed values.
+
+    Args:
+        now: Reference time for overdue/due-soon.
+        stale_before: Skip the recount if, once locked, the row was
+            reconciled at or after this time (by a concurrent caller).
+
+    Returns:
+        The refreshed TaskStats instance.
+    """
+    now = now or timezone.now()
+    due_soon_window = getattr(settings, 'TASK_STATS_DUE_SOON', DEFAULT_DUE_SOON)
+    with transaction.atomic():
+        locked = TaskStats.objects.select_for_update().filter(pk=TaskStats.SINGLETON_ID).first()
+        if stale_before and locked and locked.reconciled_at and locked.reconciled_at >= stale_before:
+            return locked
+        incomplete = Q(is_completed=False)
+        counts = Task.objects.aggregate(
+            total=Count('pk'),
+            completed=Count('pk', filter=Q(is_completed=True)),
+            overdue=Count('pk', filter=incomplete & Q(due_date__lt=now)),
+            due_soon=Count(
+                'pk',
+                filter=incomplete & Q(due_date__gte=now, due_date__lt=now + due_soon_window),
+            ),
+        )
+        stats, _ = TaskStats.objects.update_or_create(
+            pk=TaskStats.SINGLETON_ID,
+            defaults={**counts, 'reconciled_at': now},
+        )
+    return stats
+
+
+def get_stats(now=None):
+    """Return the counters row, reconciling if it is missing or stale."""
+    now = now or timezone.now()
+    stale_before = now - getattr(settings, 'TASK_STATS_MAX_AGE', DEFAULT_MAX_AGE)
+    stats = TaskStats.objects.filter(pk=TaskStats.SINGLETON_ID).first()
+    if stats is None or stats.reconciled_at is None or stats.reconciled_at < stale_before:
+        return reconcile(now, stale_before=stale_before)
+    return stats
@@ -0,0 +1,21 @@
+"""
+Background job handlers for the tasks app.
+
+Autodiscovered by the jobs app; run by `python manage.py run_worker`.
+Schedule them periodically with settings.JOB_PERIODIC instead of host cron.
+"""
+from django.core.management import call_command
+from jobs.registry import register
+from . import counters
+
+
+@register('tasks.cleanup_expired')
+def cleanup_expired(payload):
+    """Delete tasks past the 1-hour expiry (see cleanup_expired_tasks)."""
+    call_command('cleanup_expired_tasks', verbosity=0)
+
+
+@register('tasks.reconcile_stats')
+def reconcile_stats(payload):
+    """Recompute the maintained task counters."""
+    counters.reconcile()
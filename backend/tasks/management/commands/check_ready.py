@@ -0,0 +1,52 @@
+"""
+Management command running the /ready/ dependency probes.
+
+Prints each probe's outcome and latency and exits non-zero if any failed.
+With --wait it keeps probing until everything is ready, which is how
+entrypoint.sh waits for the database before migrating. --databases-only
+skips the cache and queue probes, whose tables may not exist until
+`migrate` has run.
+
+Usage:
+    python manage.py check_ready [--wait 60] [--interval 1] [--databases-only]
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from taskcloud.health import readiness, run_probes
+
+
+class Command(BaseCommand):
+    help = 'Probes the database, caches and job queue like GET /ready/'
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('--wait', type=float, default=0, help='Seconds to keep retrying until ready')
+        parser.add_argument('--interval', type=float, default=1.0, help='Seconds between attempts')
+        parser.add_argument(
+            '--databases-only',
+            action='store_true',
+            help='Only probe database connections (safe before migrate)',
+        )
+
+    def handle(self, *args, **options):
+        deadline = time.monotonic() + options['wait']
+        while True:
+            if options['databases_only']:
+                result = run_probes(databases_only=True)
+            else:
+                result = readiness(force=True)
+            if result['status'] == 'ready' or time.monotonic() >= deadline:
+                break
+            # Drop failed connections so the next attempt reconnects.
+            connections.close_all()
+            time.sleep(options['interval'])
+
+        for name, check in result['checks'].items():
+            details = ', '.join(f'{k}={v}' for k, v in check.items() if k not in ('ok', 'latency_ms'))
+            line = f"{name}: {'ok' if check['ok'] else 'FAILED'} ({check['latency_ms']}ms){' ' + details if details else ''}"
+            self.stdout.write(self.style.SUCCESS(line) if check['ok'] else self.style.ERROR(line))
+        if result['status'] != 'ready':
+            raise CommandError('Not ready')
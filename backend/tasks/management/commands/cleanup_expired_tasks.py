@@ -1,8 +1,8 @@
 """
 Management command to delete tasks older than 1 hour.
 
-This command should be run periodically via cron to automatically
-clean up expired tasks from the database.
+Run periodically by the `tasks.cleanup_expired` job (settings.JOB_PERIODIC)
+to clean up expired tasks from the database; also usable from cron.
 
 Usage:
     python manage.py cleanup_expired_tasks
@@ -10,11 +10,13 @@ Usage:
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
+from tasks import counters
 from tasks.models import Task
 
 
 class Command(BaseCommand):
     help = 'Deletes tasks that are older than 1 hour'
+    requires_system_checks = []
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -29,9 +31,9 @@ class Command(BaseCommand):
         
         # Find tasks older than 1 hour
         expired_tasks = Task.objects.filter(created_at__lt=cutoff_time)
-        count = expired_tasks.count()
         
         if options['dry_run']:
+            count = expired_tasks.count()
             self.stdout.write(
                 self.style.WARNING(
                     f'DRY RUN: Would delete {count} tasks older than 1 hour'
@@ -47,10 +49,11 @@ class Command(BaseCommand):
                 if count > 10:
                     self.stdout.write(f'  ... and {count - 10} more')
         else:
-            # Delete expired tasks
-            expired_tasks.delete()
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'Successfully deleted {count} expired tasks'
+            # Delete expired tasks, counting the rows actually removed
+            count, _ = counters.delete_tasks(expired_tasks)
+            if options['verbosity'] > 0:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'Successfully deleted {count} expired tasks'
+                    )
                 )
-            )
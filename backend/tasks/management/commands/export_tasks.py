@@ -0,0 +1,52 @@
+"""
+Management command to export all tasks as NDJSON.
+
+Streams one JSON object per line in constant memory.
+
+Usage:
+    python manage.py export_tasks [--output tasks.ndjson] [--chunk-size 5000]
+"""
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+from tasks import bulk
+
+
+class Command(BaseCommand):
+    help = 'Exports all tasks as NDJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default='-',
+            help='File to write (default: stdout)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=bulk.DEFAULT_CHUNK_SIZE,
+            help='Rows fetched per database round trip',
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        count = 0
+        if options['output'] == '-':
+            out = sys.stdout.buffer
+        else:
+            out = open(options['output'], 'wb')
+        try:
+            for line in bulk.export_lines(chunk_size=options['chunk_size']):
+                out.write(line)
+                count += 1
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+            else:
+                out.flush()
+        seconds = time.perf_counter() - start
+        rate = count / seconds if seconds else 0
+        self.stderr.write(
+            self.style.SUCCESS(f'Exported {count} tasks in {seconds:.2f}s ({rate:,.0f} rows/sec)')
+        )
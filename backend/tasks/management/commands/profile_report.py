@@ -0,0 +1,67 @@
+"""
+Management command to list and summarize saved request profiles.
+
+Reads the pstats files written by taskcloud.profiling.ProfilingMiddleware
+and prints the hottest functions across all of them.
+
+Usage:
+    python manage.py profile_report [--list] [--sort tottime] [--limit 20] [--match tasks]
+"""
+import io
+import pstats
+
+from django.core.management.base import BaseCommand
+from taskcloud.profiling import list_profiles, profile_dir
+
+
+class Command(BaseCommand):
+    help = 'Lists and summarizes saved request profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dir',
+            default=None,
+            help='Profile directory (default: PROFILING_DIR)',
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='List saved profiles instead of summarizing them',
+        )
+        parser.add_argument(
+            '--sort',
+            default='cumulative',
+            choices=['cumulative', 'tottime', 'ncalls'],
+            help='Sort key for the summary',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='Number of functions to show',
+        )
+        parser.add_argument(
+            '--match',
+            default=None,
+            help='Only include profiles whose name contains this text (e.g. a path)',
+        )
+
+    def handle(self, *args, **options):
+        directory = options['dir'] or profile_dir()
+        profiles = list_profiles(directory)
+        if options['match']:
+            profiles = [p for p in profiles if options['match'] in p.stem]
+        if not profiles:
+            self.stdout.write(self.style.WARNING(f'No profiles found in {directory}'))
+            return
+
+        if options['list']:
+            for path in profiles:
+                self.stdout.write(f'{path.stem}  ({path.stat().st_size} bytes)')
+            return
+
+        out = io.StringIO()
+        stats = pstats.Stats(*map(str, profiles), stream=out)
+        stats.sort_stats(options['sort']).print_stats(options['limit'])
+        self.stdout.write(f'Summary of {len(profiles)} profiles in {directory}')
+        self.stdout.write(out.getvalue())
@@ -0,0 +1,29 @@
+"""
+Management command to recompute the maintained task counters.
+
+Runs one aggregate() query over the task table and rewrites the TaskStats
+row, correcting any drift and refreshing the overdue/due-soon snapshot
+served by GET /api/tasks/stats/. The `tasks.reconcile_stats` job
+(settings.JOB_PERIODIC) already runs this periodically; use the command
+for a manual recount.
+
+Usage:
+    python manage.py reconcile_task_stats
+"""
+from django.core.management.base import BaseCommand
+from tasks import counters
+
+
+class Command(BaseCommand):
+    help = 'Recomputes task statistics counters from the task table'
+    requires_system_checks = []
+
+    def handle(self, *args, **options):
+        stats = counters.reconcile()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Reconciled task stats: {stats.total} total, '
+                f'{stats.completed} completed, {stats.overdue} overdue, '
+                f'{stats.due_soon} due soon'
+            )
+        )
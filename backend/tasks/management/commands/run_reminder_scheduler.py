@@ -0,0 +1,62 @@
+"""
+Management command to run the due-date reminder scheduler.
+
+Long-running: loads upcoming reminders one window at a time and fires
+them to the sinks in settings.TASK_REMINDER_SINKS. Stops cleanly on
+SIGTERM/SIGINT. After a restart it resumes from the range saved in
+ReminderState, firing reminders that came due while it was down.
+
+Usage:
+    python manage.py run_reminder_scheduler [--window 60] [--catch-up 0] [--once]
+"""
+import signal
+import threading
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from tasks.reminders import ReminderScheduler, load_sinks
+
+
+class Command(BaseCommand):
+    help = 'Runs the due-date reminder scheduler'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--window',
+            type=int,
+            default=None,
+            help='Seconds of upcoming reminders to load per pass (default: TASK_REMINDER_WINDOW)',
+        )
+        parser.add_argument(
+            '--catch-up',
+            type=int,
+            default=0,
+            help='On the first start (no saved state), also fire reminders due this many seconds ago',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Load one window, fire what is due now, and exit',
+        )
+
+    def handle(self, *args, **options):
+        scheduler = ReminderScheduler(
+            load_sinks(),
+            window=timedelta(seconds=options['window']) if options['window'] else None,
+            catch_up=timedelta(seconds=options['catch_up']),
+        )
+        if options['once']:
+            fired = scheduler.run_once()
+            self.stdout.write(self.style.SUCCESS(f'Fired {fired} reminders'))
+            return
+
+        stop = threading.Event()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: stop.set())
+        self.stdout.write(
+            f'Reminder scheduler started (window {scheduler.window.total_seconds():.0f}s)'
+        )
+        scheduler.run_forever(stop)
+        self.stdout.write(
+            self.style.SUCCESS(f'Reminder scheduler stopped after {scheduler.fired_count} reminders')
+        )
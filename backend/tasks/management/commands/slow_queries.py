@@ -0,0 +1,101 @@
+"""
+Management command to summarize the slow-query log.
+
+Groups entries written by taskcloud.slow_queries by SQL fingerprint and
+prints count, total and max time, the sources that issued each query,
+and optionally the captured EXPLAIN plan.
+
+Usage:
+    python manage.py slow_queries [--limit 10] [--sort total|max|count] [--explain] [--clear]
+"""
+import json
+
+from django.core.management.base import BaseCommand
+from taskcloud.slow_queries import log_path, normalize
+
+
+def read_entries(path):
+    """Yield log entries from the rotated file and the current one."""
+    for candidate in (path.with_name(path.name + '.1'), path):
+        if not candidate.exists():
+            continue
+        with candidate.open() as handle:
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def aggregate(entries):
+    """Return per-fingerprint stats: count, total_ms, max_ms, sources, sql, explain."""
+    stats = {}
+    for entry in entries:
+        item = stats.setdefault(entry['fingerprint'], {
+            'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            'sources': {}, 'sql': normalize(entry['sql']), 'explain': None,
+        })
+        item['count'] += 1
+        item['total_ms'] += entry['duration_ms']
+        item['max_ms'] = max(item['max_ms'], entry['duration_ms'])
+        item['sources'][entry['source']] = item['sources'].get(entry['source'], 0) + 1
+        if entry.get('explain') is not None:
+            item['explain'] = entry['explain']
+    return stats
+
+
+class Command(BaseCommand):
+    help = 'Summarizes slow queries by normalized SQL fingerprint'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=10,
+            help='Number of fingerprints to show',
+        )
+        parser.add_argument(
+            '--sort',
+            default='total',
+            choices=['total', 'max', 'count'],
+            help='Sort key',
+        )
+        parser.add_argument(
+            '--explain',
+            action='store_true',
+            help='Print the captured query plan for each fingerprint',
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Delete the slow-query log after summarizing it',
+        )
+
+    def handle(self, *args, **options):
+        path = log_path()
+        stats = aggregate(read_entries(path))
+        if not stats:
+            self.stdout.write(self.style.WARNING(f'No slow queries logged in {path}'))
+            return
+
+        sort_key = {'total': 'total_ms', 'max': 'max_ms', 'count': 'count'}[options['sort']]
+        ranked = sorted(stats.items(), key=lambda item: -item[1][sort_key])
+        self.stdout.write(f'{len(stats)} slow query fingerprints in {path}\n')
+        for key, item in ranked[:options['limit']]:
+            sources = ', '.join(
+                f'{name} x{count}' for name, count in
+                sorted(item['sources'].items(), key=lambda s: -s[1])
+            )
+            self.stdout.write(self.style.MIGRATE_HEADING(
+                f"{key}  count={item['count']}  total={item['total_ms']:.1f}ms  "
+                f"max={item['max_ms']:.1f}ms"
+            ))
+            self.stdout.write(f"  sql: {item['sql']}")
+            self.stdout.write(f'  from: {sources}')
+            if options['explain'] and item['explain'] is not None:
+                self.stdout.write('  plan: ' + json.dumps(item['explain'], indent=2).replace('\n', '\n  '))
+
+        if options['clear']:
+            for candidate in (path, path.with_name(path.name + '.1')):
+                candidate.unlink(missing_ok=True)
+            self.stdout.write(self.style.SUCCESS('Cleared slow-query log'))
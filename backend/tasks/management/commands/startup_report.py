@@ -0,0 +1,95 @@
+"""
+Management command to report process cold-start time.
+
+Boots fresh interpreters (see taskcloud.startup) and prints the median
+time of each boot phase, the time to first request, and the packages
+whose imports cost the most in each phase. Use --json to record results
+and --budget-ms to fail when time to first request regresses.
+
+Usage:
+    python manage.py startup_report [--runs 3] [--path /health/] [--top 10] [--json] [--budget-ms 1500]
+"""
+import json
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+from taskcloud.startup import PHASES, measure_startup
+
+FIRST_REQUEST_PHASES = ['setup', 'application', 'first request']
+
+
+class Command(BaseCommand):
+    help = 'Reports startup phase timings and an import-time breakdown'
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Fresh processes to boot; medians are reported')
+        parser.add_argument('--path', default='/health/', help='Path requested after startup')
+        parser.add_argument('--top', type=int, default=10, help='Packages to list in the import breakdown')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+        parser.add_argument(
+            '--budget-ms',
+            type=float,
+            help='Exit with an error if time to first request exceeds this',
+        )
+
+    def handle(self, *args, **options):
+        runs = []
+        for _ in range(max(options['runs'], 1)):
+            try:
+                runs.append(measure_startup(options['path']))
+            except RuntimeError as exc:
+                raise CommandError(f'Startup measurement failed: {exc}') from exc
+        for run in runs:
+            run['first_request'] = sum(run['timings'][name] for name in FIRST_REQUEST_PHASES)
+        # Import breakdown from the run with the median time to first request.
+        runs.sort(key=lambda run: run['first_request'])
+        median_run = runs[len(runs) // 2]
+
+        report = {
+            'path': options['path'],
+            'status': median_run['status'],
+            'runs': len(runs),
+            'phases_ms': {
+                name: round(statistics.median(run['timings'][name] for run in runs) * 1000, 1)
+                for name in PHASES
+            },
+            'first_request_ms': round(median_run['first_request'] * 1000, 1),
+            'process_ms': round(statistics.median(run['total'] for run in runs) * 1000, 1),
+            'imports': self.top_imports(median_run['imports'], options['top']),
+        }
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.print_report(report)
+
+        budget = options['budget_ms']
+        if budget is not None and report['first_request_ms'] > budget:
+            raise CommandError(
+                f"Time to first request {report['first_request_ms']}ms exceeds budget {budget}ms"
+            )
+
+    def top_imports(self, imports, top):
+        """Return the heaviest packages as [{phase, package, modules, ms}]."""
+        rows = [
+            {'phase': phase, 'package': package, 'modules': modules, 'ms': round(seconds * 1000, 1)}
+            for phase, packages in imports.items()
+            for package, (modules, seconds) in packages.items()
+        ]
+        rows.sort(key=lambda row: -row['ms'])
+        return rows[:top]
+
+    def print_report(self, report):
+        self.stdout.write(
+            f"Startup, median of {report['runs']} runs (GET {report['path']} -> {report['status']})\n"
+        )
+        for name, ms in report['phases_ms'].items():
+            self.stdout.write(f'  {name:<24}{ms:>9.1f} ms')
+        self.stdout.write(f"  {'time to first request':<24}{report['first_request_ms']:>9.1f} ms")
+        self.stdout.write(f"  {'process total':<24}{report['process_ms']:>9.1f} ms")
+
+        self.stdout.write('\nSlowest imports (self time, by package)\n')
+        self.stdout.write(f"  {'phase':<16}{'package':<32}{'modules':>8}{'ms':>9}")
+        for row in report['imports']:
+            self.stdout.write(f"  {row['phase']:<16}{row['package']:<32}{row['modules']:>8}{row['ms']:>9.1f}")
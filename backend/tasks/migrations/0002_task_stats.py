@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:54
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def seed_task_stats(apps, schema_editor):
+    """Create the counters row from the existing tasks."""
+    Task = apps.get_model('tasks', 'Task')
+    TaskStats = apps.get_model('tasks', 'TaskStats')
+    counts = Task.objects.aggregate(
+        total=Count('pk'),
+        completed=Count('pk', filter=Q(is_completed=True)),
+    )
+    TaskStats.objects.update_or_create(pk=1, defaults=counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskStats',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False)),
+                ('total', models.BigIntegerField(default=0)),
+                ('completed', models.BigIntegerField(default=0)),
+                ('overdue', models.BigIntegerField(default=0)),
+                ('due_soon', models.BigIntegerField(default=0)),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'task stats',
+            },
+        ),
+        migrations.RunPython(seed_task_stats, migrations.RunPython.noop),
+    ]
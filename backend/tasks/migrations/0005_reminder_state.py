@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0004_task_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderState',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False)),
+                ('watermark', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ReminderFired',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.UUIDField()),
+                ('due_date', models.DateTimeField()),
+                ('fired_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['due_date'], name='reminder_fired_due_idx')],
+                'constraints': [models.UniqueConstraint(fields=('task_id', 'due_date'), name='reminder_fired_unique')],
+            },
+        ),
+    ]
@@ -33,8 +33,105 @@ class Task(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['-created_at']),
+            # Default ordering and the admin's keyset paging on
+            # (created_at, id) (see tasks.changelist).
+            models.Index(fields=['-created_at', '-id'], name='task_created_id_idx'),
+            # Pending reminders: the scheduler scans due_date windows of
+            # incomplete tasks only (see tasks.reminders).
+            models.Index(
+                fields=['due_date'],
+                name='task_pending_due_idx',
+                condition=models.Q(is_completed=False),
+            ),
         ]
 
     def __str__(self):
         return self.title
+
+
+class TaskStats(models.Model):
+    """
+    Single-row table of maintained task counters.
+
+    `total` and `completed` are adjusted in place by the views, admin and
+    `cleanup_expired_tasks` (see tasks.counters). `overdue` and `due_soon`
+    depend on the clock, so they are snapshots refreshed together with
+    the other counters by the periodic reconciliation pass.
+
+    Attributes:
+        total: Number of tasks.
+        completed: Number of completed tasks.
+        overdue: Incomplete tasks past their due_date (as of reconciled_at).
+        due_soon: Incomplete tasks due within TASK_STATS_DUE_SOON (as of reconciled_at).
+        reconciled_at: When the counters were last recomputed from the table.
+    """
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID, editable=False)
+    total = models.BigIntegerField(default=0)
+    completed = models.BigIntegerField(default=0)
+    overdue = models.BigIntegerField(default=0)
+    due_soon = models.BigIntegerField(default=0)
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = 'task stats'
+
+    @property
+    def active(self):
+        return self.total - self.completed
+
+    def __str__(self):
+        return f'{self.total} tasks ({self.completed} completed)'
+
+
+class ReminderState(models.Model):
+    """
+    Single-row table where the reminder scheduler records its progress.
+
+    Every reminder due (minus the lead time) before `watermark` has been
+    fired or is recorded in ReminderFired, so a restarted scheduler
+    reloads from `watermark` instead of dropping what came due while it
+    was down (see tasks.reminders).
+
+    Attributes:
+        watermark: Start of the reminder range the last window load read.
+        updated_at: When the scheduler last loaded a window.
+    """
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID, editable=False)
+    watermark = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'Reminders loaded from {self.watermark.isoformat()}'
+
+
+class ReminderFired(models.Model):
+    """
+    A reminder already delivered, by task and the due date it was for.
+
+    Rows below the scheduler's watermark are pruned on each window load,
+    so the table only covers the range a restart could read again.
+    Plain task_id (no foreign key) so deleting tasks never touches it.
+
+    Attributes:
+        task_id: The reminded task's id.
+        due_date: The due date the reminder was for.
+        fired_at: When the reminder was sent.
+    """
+    task_id = models.UUIDField()
+    due_date = models.DateTimeField()
+    fired_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['task_id', 'due_date'], name='reminder_fired_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['due_date'], name='reminder_fired_due_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.task_id} @ {self.due_date.isoformat()}'
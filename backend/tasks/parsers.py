@@ -0,0 +1,21 @@
+"""
+MessagePack parser for the task API.
+
+Selected when the request has `Content-Type: application/msgpack`.
+Requires the optional `msgpack` package.
+"""
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from .renderers import MSGPACK_MEDIA_TYPE
+
+
+class MessagePackParser(BaseParser):
+    """Parse a MessagePack request body into Python data."""
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack parse error - {exc}')
@@ -0,0 +1,217 @@
+"""
+Due-date reminder scheduler.
+
+Instead of polling the task table for due tasks, the scheduler loads one
+window of upcoming reminders at a time (a range scan on the partial
+`task_pending_due_idx` index) into an in-memory heap, then sleeps until
+the earliest reminder is due and fires it. The window is reloaded every
+`window` so completions and due-date edits are picked up.
+
+Each load starts at the previous load's start time, and reminders already
+fired are recorded by (task id, due date) in ReminderFired. A task created
+after its window was loaded is therefore reminded at the next load, at
+most `window` late, never missed or duplicated.
+
+Progress survives restarts: each load saves where its range started in
+ReminderState, and a restarted scheduler reloads from there, so reminders
+that came due while it was down are fired late rather than dropped, and
+the ReminderFired rows keep already fired ones from repeating. Markers
+are written after the sinks are called, so a crash in between can repeat
+the reminders of that one batch (at-least-once delivery).
+
+Reminders are delivered to pluggable sinks configured by
+settings.TASK_REMINDER_SINKS (dotted paths to classes with a
+`send(reminder)` method).
+
+Usage:
+    python manage.py run_reminder_scheduler
+"""
+import heapq
+import json
+import logging
+import threading
+import urllib.request
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import ReminderFired, ReminderState, Task
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = timedelta(seconds=60)
+DEFAULT_LEAD = timedelta(0)
+DEFAULT_SINKS = ['tasks.reminders.LogReminderSink']
+
+
+@dataclass(frozen=True)
+class Reminder:
+    """A single reminder event for a task's due date."""
+    task_id: str
+    title: str
+    due_date: datetime
+    fire_at: datetime
+
+    def as_dict(self):
+        return {
+            'task_id': self.task_id,
+            'title': self.title,
+            'due_date': self.due_date.isoformat(),
+            'fire_at': self.fire_at.isoformat(),
+        }
+
+
+class LogReminderSink:
+    """Write reminders to the `tasks.reminders` logger."""
+
+    def send(self, reminder):
+        logger.info('Reminder: %s due %s', reminder.title, reminder.due_date.isoformat())
+
+
+class WebhookReminderSink:
+    """
+    POST reminders as JSON to settings.TASK_REMINDER_WEBHOOK_URL.
+
+    Stand-in for a push/notification service; failures are logged and
+    never stop the scheduler.
+    """
+
+    def __init__(self, url=None, timeout=5):
+        self.url = url or getattr(settings, 'TASK_REMINDER_WEBHOOK_URL', '')
+        self.timeout = timeout
+
+    def send(self, reminder):
+        if not self.url:
+            return
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(reminder.as_dict()).encode(),
+            headers={'Content-Type': 'application/json'},
+            method='POST',
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout):
+                pass
+        except OSError:
+            logger.exception('Reminder webhook failed for task %s', reminder.task_id)
+
+
+class MemoryReminderSink:
+    """Keep the most recent reminders in an in-process feed."""
+
+    def __init__(self, maxlen=1000):
+        self.events = deque(maxlen=maxlen)
+
+    def send(self, reminder):
+        self.events.append(reminder)
+
+
+def load_sinks(paths=None):
+    """Instantiate the sink classes named in settings.TASK_REMINDER_SINKS."""
+    paths = paths if paths is not None else getattr(settings, 'TASK_REMINDER_SINKS', DEFAULT_SINKS)
+    return [import_string(path)() for path in paths]
+
+
+class ReminderScheduler:
+    """
+    Fire task reminders from an in-memory heap refreshed once per window.
+
+    Args:
+        sinks: Objects with a `send(reminder)` method.
+        window: How far ahead each load looks, and how often it reloads.
+        lead: How long before due_date a reminder fires.
+        catch_up: On the first start (no saved ReminderState), also fire
+            reminders due this far in the past.
+        clock: Callable returning the current aware datetime.
+    """
+
+    def __init__(self, sinks, window=None, lead=None, catch_up=timedelta(0), clock=timezone.now):
+        self.sinks = sinks
+        self.window = window or getattr(settings, 'TASK_REMINDER_WINDOW', DEFAULT_WINDOW)
+        self.lead = lead if lead is not None else getattr(settings, 'TASK_REMINDER_LEAD', DEFAULT_LEAD)
+        self.clock = clock
+        self.catch_up = catch_up
+        self._heap = []
+        self._watermark = None
+        self._next_load = None
+        self.fired_count = 0
+
+    def load(self, now):
+        """
+        Load reminders due between the watermark and the end of the next window.
+
+        Returns:
+            The number of reminders queued.
+        """
+        start = self._watermark
+        if start is None:
+            state = ReminderState.objects.filter(pk=ReminderState.SINGLETON_ID).first()
+            start = state.watermark if state else now - self.catch_up
+        due_range = (start + self.lead, now + self.window + self.lead)
+        rows = (
+            Task.objects
+            .filter(is_completed=False, due_date__gte=due_range[0], due_date__lt=due_range[1])
+            .order_by('due_date')
+            .values_list('id', 'title', 'due_date')
+        )
+        fired = set(
+            ReminderFired.objects
+            .filter(due_date__gte=due_range[0], due_date__lt=due_range[1])
+            .values_list('task_id', 'due_date')
+        )
+        heap = []
+        for task_id, title, due_date in rows.iterator(chunk_size=2000):
+            if (task_id, due_date) not in fired:
+                heap.append((due_date - self.lead, task_id, title, due_date))
+        heapq.heapify(heap)
+        self._heap = heap
+        # A restart reloads from `start`; older markers are never read again.
+        ReminderFired.objects.filter(due_date__lt=due_range[0]).delete()
+        ReminderState.objects.update_or_create(
+            pk=ReminderState.SINGLETON_ID, defaults={'watermark': start},
+        )
+        self._watermark = now
+        self._next_load = now + self.window
+        return len(heap)
+
+    def fire_due(self, now):
+        """Send every queued reminder whose fire time has passed and record it."""
+        fired = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, task_id, title, due_date = heapq.heappop(self._heap)
+            reminder = Reminder(task_id=str(task_id), title=title, due_date=due_date, fire_at=fire_at)
+            for sink in self.sinks:
+                try:
+                    sink.send(reminder)
+                except Exception:
+                    logger.exception('Reminder sink %r failed', sink)
+            fired.append(ReminderFired(task_id=task_id, due_date=due_date))
+        if fired:
+            ReminderFired.objects.bulk_create(fired, ignore_conflicts=True)
+        self.fired_count += len(fired)
+        return len(fired)
+
+    def next_wakeup(self):
+        """Return when the scheduler next has work: a reminder or a reload."""
+        if self._heap:
+            return min(self._heap[0][0], self._next_load)
+        return self._next_load
+
+    def run_once(self):
+        """Load if a reload is due, then fire everything due now."""
+        now = self.clock()
+        if self._next_load is None or now >= self._next_load:
+            self.load(now)
+        return self.fire_due(now)
+
+    def run_forever(self, stop_event=None):
+        """Run until `stop_event` is set, sleeping between reminders."""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            self.run_once()
+            delay = (self.next_wakeup() - self.clock()).total_seconds()
+            stop_event.wait(max(delay, 0))
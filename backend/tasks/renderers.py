@@ -0,0 +1,34 @@
+"""
+MessagePack renderer for the task API.
+
+Selected when the client sends `Accept: application/msgpack`. MessagePack
+is a compact binary encoding of the same structure the JSON renderer
+produces, so clients can switch formats without any schema changes.
+Requires the optional `msgpack` package.
+"""
+import msgpack
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+
+# Reuse DRF's JSON conversions (UUID, datetime, Decimal, ...) so both wire
+# formats carry identical values.
+_encoder = JSONEncoder()
+
+
+def _default(obj):
+    return _encoder.default(obj)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Render response data as MessagePack."""
+    media_type = MSGPACK_MEDIA_TYPE
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_default, use_bin_type=True)
@@ -4,7 +4,7 @@ DRF serializers for Task model.
 Uses ModelSerializer for automatic field serialization and validation.
 """
 from rest_framework import serializers
-from .models import Task
+from .models import Task, TaskStats
 
 
 class TaskSerializer(serializers.ModelSerializer):
@@ -22,17 +22,29 @@ class TaskSerializer(serializers.ModelSerializer):
         due_date (datetime): Optional. Deadline for task completion.
         is_completed (bool): Task completion status. Defaults to False.
 
+    Args:
+        fields: Optional list of field names; output is restricted to
+            these (sparse fieldsets, `?fields=` on the task views).
+
     Usage:
         # Deserialize and create
         serializer = TaskSerializer(data=request.data)
         if serializer.is_valid():
             task = serializer.save()
 
-        # Serialize for response
-        serializer = TaskSerializer(task)
-        return Response(serializer.data)
+        # Serialize, optionally as a sparse fieldset
+        data = TaskSerializer(task).data
+        data = TaskSerializer(task, fields=['id', 'title']).data
     """
 
+    def __init__(self, *args, **kwargs):
+        # Optional `fields` kwarg restricts output to a subset of Meta.fields.
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
     class Meta:
         model = Task
         fields = [
@@ -44,3 +56,48 @@ class TaskSerializer(serializers.ModelSerializer):
             'is_completed',
         ]
         read_only_fields = ['id', 'created_at']
+
+
+class TaskStatsSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for the maintained task counters.
+
+    Fields:
+        total (int): Number of tasks.
+        completed (int): Number of completed tasks.
+        active (int): Number of incomplete tasks.
+        overdue (int): Incomplete tasks past their due date, as of reconciled_at.
+        due_soon (int): Incomplete tasks due shortly, as of reconciled_at.
+        reconciled_at (datetime): When counters were last recomputed from the table.
+    """
+    active = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = TaskStats
+        fields = [
+            'total',
+            'completed',
+            'active',
+            'overdue',
+            'due_soon',
+            'reconciled_at',
+        ]
+        read_only_fields = fields
+
+
+class TaskImportResultSerializer(serializers.Serializer):
+    """
+    Response body of POST /api/tasks/import/ (see tasks.bulk.ImportResult).
+
+    Fields:
+        imported (int): Tasks created.
+        rejected (int): Lines skipped as invalid or in a failed chunk.
+        seconds (float): Time spent importing.
+        rows_per_sec (int): Import throughput.
+        errors (list[str]): The first error messages, with line numbers.
+    """
+    imported = serializers.IntegerField()
+    rejected = serializers.IntegerField()
+    seconds = serializers.FloatField()
+    rows_per_sec = serializers.IntegerField()
+    errors = serializers.ListField(child=serializers.CharField())
@@ -0,0 +1,184 @@
+"""
+Tests for the scalable Task admin changelist (tasks.changelist).
+"""
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+from html import unescape
+
+import pytest
+from django.db.models import Max, Min, QuerySet
+from tasks.changelist import (
+    CURSOR_VAR, ChangeListQuerySet, EstimatedCountPaginator, decode_cursor, encode_cursor, estimate_count,
+)
+from tasks.models import Task
+
+CHANGELIST_URL = '/admin/tasks/task/'
+NEXT_LINK = re.compile(r'<a href="([^"]+)" class="end">')
+
+
+def make_tasks(count, start=datetime(2025, 11, 20, tzinfo=dt_timezone.utc), step=timedelta(days=3)):
+    """Create tasks with created_at spaced `step` apart, oldest first."""
+    tasks = Task.objects.bulk_create(Task(title=f'Task {i}') for i in range(count))
+    for i, task in enumerate(tasks):
+        task.created_at = start + step * i
+    Task.objects.bulk_update(tasks, ['created_at'])
+    return tasks
+
+
+def next_url(response):
+    match = NEXT_LINK.search(response.content.decode())
+    return unescape(match.group(1)) if match else None
+
+
+@pytest.mark.django_db
+class TestTaskChangeList:
+    """Test suite for keyset paging, deferred fields and the date hierarchy."""
+
+    def test_keyset_pages_cover_all_rows_once(self, admin_client):
+        """
+        Test following Next links visits every task once, newest first.
+        """
+        tasks = make_tasks(250)
+        seen, url = [], CHANGELIST_URL
+        while url:
+            response = admin_client.get(CHANGELIST_URL + url if url.startswith('?') else url)
+            assert response.status_code == 200
+            seen.extend(task.pk for task in response.context['cl'].result_list)
+            url = next_url(response)
+
+        expected = [task.pk for task in sorted(tasks, key=lambda t: (t.created_at, t.pk), reverse=True)]
+        assert seen == expected
+
+    def test_no_next_link_on_exactly_full_last_page(self, admin_client):
+        """
+        Test a final page of exactly list_per_page rows has no Next link.
+        """
+        make_tasks(100)
+
+        response = admin_client.get(CHANGELIST_URL)
+
+        assert len(response.context['cl'].result_list) == 100
+        assert next_url(response) is None
+
+    def test_invalid_cursor_redirects_with_error_flag(self, admin_client):
+        """
+        Test a malformed cursor is treated as an invalid lookup.
+        """
+        response = admin_client.get(CHANGELIST_URL, {CURSOR_VAR: 'not-a-cursor'})
+
+        assert response.status_code == 302
+        assert response.url.endswith('?e=1')
+
+    def test_filter_links_drop_cursor(self, admin_client):
+        """
+        Test the cursor is not treated as a lookup nor kept in filter links.
+        """
+        tasks = make_tasks(3)
+        cursor = encode_cursor(tasks[-1])
+
+        response = admin_client.get(CHANGELIST_URL, {CURSOR_VAR: cursor, 'is_completed__exact': '0'})
+
+        cl = response.context['cl']
+        assert response.status_code == 200
+        assert [task.pk for task in cl.result_list] == [tasks[1].pk, tasks[0].pk]
+        assert CURSOR_VAR not in cl.get_query_string({'is_completed__exact': '1'})
+        assert CURSOR_VAR not in cl.params
+
+    def test_description_is_deferred(self, admin_client):
+        """
+        Test the changelist does not load task descriptions.
+        """
+        make_tasks(2)
+
+        response = admin_client.get(CHANGELIST_URL)
+
+        for task in response.context['cl'].result_list:
+            assert 'description' in task.get_deferred_fields()
+
+    def test_search_matches_title_only(self, admin_client):
+        """
+        Test search looks at titles, not the deferred descriptions.
+        """
+        Task.objects.create(title='Quarterly report')
+        Task.objects.create(title='Other', description='report draft')
+
+        response = admin_client.get(CHANGELIST_URL, {'q': 'report'})
+
+        assert [task.title for task in response.context['cl'].result_list] == ['Quarterly report']
+
+    def test_custom_ordering_uses_page_numbers(self, admin_client):
+        """
+        Test sorting by another column falls back to offset pagination.
+        """
+        make_tasks(150)
+
+        response = admin_client.get(CHANGELIST_URL, {'o': '1', 'p': '2'})
+
+        cl = response.context['cl']
+        assert not cl.keyset
+        assert len(cl.result_list) == 50
+
+    def test_date_hierarchy_buckets_match_stock_queryset(self, settings):
+        """
+        Test the indexed datetimes() returns the same buckets as Django's.
+        """
+        settings.TIME_ZONE = 'UTC'
+        make_tasks(40)
+        stock = Task.objects.all()
+        indexed = ChangeListQuerySet(model=Task)
+
+        for kind in ('year', 'month', 'day'):
+            assert list(indexed.datetimes('created_at', kind)) == list(stock.datetimes('created_at', kind))
+        assert (indexed.aggregate(first=Min('created_at'), last=Max('created_at'))
+                == stock.aggregate(first=Min('created_at'), last=Max('created_at')))
+        december = {'created_at__year': 2025, 'created_at__month': 12}
+        assert (list(indexed.filter(**december).datetimes('created_at', 'day', order='DESC'))
+                == list(stock.filter(**december).datetimes('created_at', 'day', order='DESC')))
+
+    def test_date_hierarchy_drilldown_renders(self, admin_client):
+        """
+        Test year and month drill-down pages render with the hierarchy.
+        """
+        make_tasks(40)
+
+        response = admin_client.get(CHANGELIST_URL, {'created_at__year': '2026'})
+
+        assert response.status_code == 200
+        assert 'created_at__month=' in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestEstimatedCounts:
+    """Test suite for EstimatedCountPaginator."""
+
+    def test_falls_back_to_exact_count_without_statistics(self):
+        """
+        Test backends without planner statistics get an exact count.
+        """
+        make_tasks(5)
+        paginator = EstimatedCountPaginator(Task.objects.all(), 2)
+
+        assert estimate_count(Task.objects.all()) is None
+        assert paginator.count == 5
+        assert not paginator.estimated
+
+    def test_uses_estimate_above_exact_limit(self, monkeypatch, settings):
+        """
+        Test a planner estimate above the limit replaces COUNT(*).
+        """
+        settings.TASK_ADMIN_EXACT_COUNT_LIMIT = 1000
+        monkeypatch.setattr('tasks.changelist.estimate_count', lambda queryset: 1_000_000)
+        monkeypatch.setattr(QuerySet, 'count', lambda self: pytest.fail('exact count'))
+
+        paginator = EstimatedCountPaginator(Task.objects.all(), 100)
+
+        assert paginator.count == 1_000_000
+        assert paginator.estimated
+
+    def test_cursor_round_trip(self):
+        """
+        Test encode_cursor/decode_cursor preserve (created_at, id).
+        """
+        task = make_tasks(1)[0]
+
+        assert decode_cursor(encode_cursor(task)) == (task.created_at, task.pk)
@@ -220,3 +220,119 @@ class TestTaskDetailAPI:
         response = api_client.delete(f'/api/tasks/{fake_uuid}/')
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """Test suite for ?fields= projections on task endpoints."""
+
+    def test_list_with_fields(self, api_client, sample_task):
+        """
+        Test GET /api/tasks/?fields=id,title returns only those fields.
+
+        Expected:
+        - Status 200 OK
+        - Each item carries exactly the requested keys
+        """
+        response = api_client.get('/api/tasks/?fields=id,title')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data[0].keys()) == {'id', 'title'}
+        assert response.data[0]['title'] == sample_task.title
+
+    def test_retrieve_with_fields(self, api_client, sample_task):
+        """
+        Test GET /api/tasks/<id>/?fields=is_completed projects a single task.
+        """
+        response = api_client.get(f'/api/tasks/{sample_task.id}/?fields=is_completed')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'is_completed': False}
+
+    def test_fields_pushed_into_select(self, api_client, sample_task):
+        """
+        Test the projection defers unrequested columns in the SQL query.
+
+        Expected:
+        - The description column is not selected
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            api_client.get('/api/tasks/?fields=id,title')
+
+        select = [q['sql'] for q in ctx.captured_queries if 'tasks_task' in q['sql']]
+        assert select
+        assert 'description' not in select[0]
+
+    def test_unknown_field(self, api_client):
+        """
+        Test GET /api/tasks/?fields=bogus returns 400.
+        """
+        response = api_client.get('/api/tasks/?fields=id,bogus')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'fields' in response.data
+
+    def test_fields_ignored_on_write(self, api_client, sample_task):
+        """
+        Test PATCH with ?fields= still returns the full task.
+        """
+        response = api_client.patch(
+            f'/api/tasks/{sample_task.id}/?fields=id',
+            {'is_completed': True},
+            format='json',
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['is_completed'] is True
+        assert 'title' in response.data
+
+
+@pytest.mark.django_db
+class TestMessagePackFormat:
+    """Test suite for the application/msgpack renderer and parser."""
+
+    def test_list_as_msgpack(self, api_client, sample_task):
+        """
+        Test GET /api/tasks/ with Accept: application/msgpack.
+
+        Expected:
+        - Binary body decoding to the same data as the JSON response
+        """
+        msgpack = pytest.importorskip('msgpack')
+        response = api_client.get('/api/tasks/', HTTP_ACCEPT='application/msgpack')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/msgpack'
+        data = msgpack.unpackb(response.content)
+        assert data[0]['id'] == str(sample_task.id)
+        assert data[0]['title'] == sample_task.title
+
+    def test_create_from_msgpack(self, api_client):
+        """
+        Test POST /api/tasks/ with a MessagePack body.
+        """
+        msgpack = pytest.importorskip('msgpack')
+        response = api_client.post(
+            '/api/tasks/',
+            msgpack.packb({'title': 'Packed Task'}),
+            content_type='application/msgpack',
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Task.objects.filter(title='Packed Task').exists()
+
+    def test_malformed_msgpack(self, api_client):
+        """
+        Test POST /api/tasks/ with a truncated MessagePack body returns 400.
+        """
+        pytest.importorskip('msgpack')
+        response = api_client.post(
+            '/api/tasks/',
+            b'\x81\xa5titl',
+            content_type='application/msgpack',
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
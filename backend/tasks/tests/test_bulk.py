@@ -0,0 +1,204 @@
+"""
+Tests for NDJSON bulk import/export (tasks.bulk) and its endpoints.
+"""
+import json
+import pytest
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks import bulk
+from tasks.models import Task, TaskStats
+
+
+@pytest.fixture(autouse=True)
+def reset_throttles():
+    """Bulk endpoints are throttled; start each test with a clean slate."""
+    cache.clear()
+
+
+@pytest.fixture
+def api_client():
+    """Provide DRF API client for tests."""
+    return APIClient()
+
+
+def ndjson(*rows):
+    return ''.join(json.dumps(row) + '\n' for row in rows)
+
+
+@pytest.mark.django_db
+class TestBulkImportExport:
+    """Test suite for tasks.bulk and the import/export commands."""
+
+    def test_round_trip(self, tmp_path):
+        """
+        Test export_tasks output re-imports to identical rows.
+        """
+        Task.objects.create(title='One', description='first', is_completed=True)
+        Task.objects.create(title='Two')
+        path = tmp_path / 'tasks.ndjson'
+        call_command('export_tasks', '--output', str(path), stderr=StringIO())
+        before = list(Task.objects.order_by('title').values())
+        Task.objects.all().delete()
+
+        out = StringIO()
+        call_command('import_tasks', str(path), stdout=out)
+
+        assert 'Imported 2 tasks (0 rejected)' in out.getvalue()
+        assert list(Task.objects.order_by('title').values()) == before
+
+    def test_invalid_lines_are_reported(self):
+        """
+        Test invalid lines are skipped with line numbers while valid ones import.
+        """
+        lines = ndjson(
+            {'title': 'Good'},
+            {'title': ''},
+            {'title': 'x' * 201},
+            {'title': 'Bad date', 'due_date': 'tomorrow'},
+        ) + '{not json\n'
+
+        result = bulk.import_lines(StringIO(lines), chunk_size=2)
+
+        assert result.imported == 1
+        assert result.rejected == 4
+        assert [e.split(':')[0] for e in result.errors] == ['line 2', 'line 3', 'line 4', 'line 5']
+
+    def test_duplicate_id_rejects_chunk_only(self):
+        """
+        Test a database error rejects its own chunk and the import continues.
+        """
+        existing = Task.objects.create(title='Existing')
+        lines = ndjson(
+            {'id': str(existing.id), 'title': 'Clash'},
+            {'title': 'Next chunk'},
+        )
+
+        result = bulk.import_lines(StringIO(lines), chunk_size=1, trusted=True)
+
+        assert result.imported == 1
+        assert result.rejected == 1
+        assert Task.objects.filter(title='Next chunk').exists()
+
+    def test_untrusted_import_ignores_read_only_fields(self):
+        """
+        Test id and created_at are only kept when trusted, and strings are trimmed.
+        """
+        row = {
+            'id': '6f1c2d9e-8a4b-4c1e-9f3a-2b7d5e8c0a11',
+            'title': '  Padded  ',
+            'description': ' text\n',
+            'created_at': '2030-01-01T00:00:00+00:00',
+        }
+
+        bulk.import_lines(StringIO(ndjson(row)))
+        task = Task.objects.get()
+        assert str(task.id) != row['id']
+        assert task.created_at.year != 2030
+        assert (task.title, task.description) == ('Padded', 'text')
+
+        bulk.import_lines(StringIO(ndjson(row)), trusted=True)
+        assert Task.objects.filter(id=row['id'], created_at__year=2030).exists()
+
+    def test_import_updates_counters(self):
+        """
+        Test imported rows are added to the maintained task counters.
+        """
+        bulk.import_lines(StringIO(ndjson({'title': 'A'}, {'title': 'B', 'is_completed': True})))
+
+        stats = TaskStats.objects.get()
+        assert (stats.total, stats.completed) == (2, 1)
+
+
+@pytest.mark.django_db
+class TestBulkAPI:
+    """Test suite for GET /api/tasks/export/ and POST /api/tasks/import/."""
+
+    def test_export_streams_ndjson(self, api_client):
+        """
+        Test export returns one JSON object per line.
+        """
+        Task.objects.create(title='Streamed')
+
+        response = api_client.get('/api/tasks/export/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        assert json.loads(lines[0])['title'] == 'Streamed'
+
+    def test_import_endpoint(self, api_client, settings):
+        """
+        Test import creates tasks and enforces TASK_IMPORT_API_MAX_ROWS.
+        """
+        settings.TASK_IMPORT_API_MAX_ROWS = 2
+        body = ndjson({'title': 'A'}, {'title': 'B'}, {'title': 'C'})
+
+        response = api_client.post('/api/tasks/import/', body, content_type='application/x-ndjson')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['imported'] == 2
+        assert 'limited to 2 rows' in response.data['errors'][0]
+        assert Task.objects.count() == 2
+
+    def test_import_ignores_client_created_at(self, api_client):
+        """
+        Test an imported task cannot backdate or postdate created_at to escape auto-delete.
+        """
+        body = ndjson({'title': 'Forever', 'created_at': '2999-01-01T00:00:00+00:00'})
+
+        response = api_client.post('/api/tasks/import/', body, content_type='application/x-ndjson')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Task.objects.get().created_at.year != 2999
+
+    def test_import_size_limits(self, api_client, settings):
+        """
+        Test overlong lines are rejected and oversized bodies get a 413.
+        """
+        settings.TASK_IMPORT_API_MAX_LINE_BYTES = 100
+        body = ndjson({'title': 'A'}, {'title': 'B', 'description': 'x' * 500}, {'title': 'C'})
+
+        response = api_client.post('/api/tasks/import/', body, content_type='application/x-ndjson')
+
+        assert response.data['imported'] == 2
+        assert response.data['errors'] == ['line 2: line exceeds 100 bytes']
+
+        settings.TASK_IMPORT_API_MAX_BYTES = 10
+        response = api_client.post('/api/tasks/import/', body, content_type='application/x-ndjson')
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert Task.objects.count() == 2
+
+    def test_bulk_endpoints_refuse_html(self, api_client):
+        """
+        Test browser-style requests get JSON errors instead of a browsable API 500.
+        """
+        response = api_client.get('/api/tasks/import/', HTTP_ACCEPT='text/html')
+        assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
+
+        response = api_client.get('/api/tasks/import/', HTTP_ACCEPT='text/html,*/*;q=0.8')
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        assert response['Content-Type'] == 'application/json'
+
+    def test_export_matches_api_datetimes(self, api_client):
+        """
+        Test exported datetimes are formatted exactly as the JSON API renders them.
+        """
+        task = Task.objects.create(title='Dated', due_date='2030-01-01T09:30:00Z')
+
+        line = json.loads(b''.join(bulk.export_lines()))
+        detail = api_client.get(f'/api/tasks/{task.id}/').json()
+
+        assert line['created_at'] == detail['created_at']
+        assert line['due_date'] == detail['due_date'] == '2030-01-01T09:30:00Z'
+
+    def test_import_empty_body(self, api_client):
+        """
+        Test an empty import is a 400.
+        """
+        response = api_client.post('/api/tasks/import/', '', content_type='application/x-ndjson')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
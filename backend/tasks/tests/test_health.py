@@ -0,0 +1,165 @@
+"""
+Tests for /health/ liveness and /ready/ readiness probes.
+"""
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+from django.conf import settings as django_settings
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from taskcloud import health
+
+
+@pytest.fixture
+def api_client():
+    """Provide a client with no cached readiness result."""
+    health.reset_readiness()
+    yield APIClient()
+    health.reset_readiness()
+
+
+@pytest.mark.django_db
+class TestHealthEndpoints:
+    """Test suite for the liveness and readiness endpoints."""
+
+    def test_health_runs_no_queries(self, api_client):
+        """
+        Test /health/ answers without touching the database.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get('/health/')
+
+        assert response.status_code == 200
+        assert response.json() == {'status': 'healthy'}
+        assert len(queries) == 0
+
+    def test_ready_reports_probes(self, api_client):
+        """
+        Test /ready/ probes the database and queue and reports latencies.
+        """
+        response = api_client.get('/ready/')
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data['status'] == 'ready'
+        assert set(data['checks']) == {'database:default', 'queue'}
+        database = data['checks']['database:default']
+        assert database['ok'] is True
+        assert database['latency_ms'] >= 0
+        assert database['pool'] is None
+        assert data['checks']['queue']['lag_seconds'] == 0
+
+    def test_ready_reuses_cached_result(self, api_client, settings):
+        """
+        Test repeated /ready/ calls within the TTL run no further queries.
+        """
+        settings.READINESS_CACHE_TTL = 60
+        api_client.get('/ready/')
+
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(5):
+                response = api_client.get('/ready/')
+
+        assert response.status_code == 200
+        assert len(queries) == 0
+
+    def test_ready_returns_503_when_a_probe_fails(self, api_client, monkeypatch):
+        """
+        Test a failing database probe marks the process unavailable.
+        """
+        def broken(alias):
+            raise ConnectionError('connection refused by db.internal:5432')
+
+        monkeypatch.setattr(health, 'probe_database', broken)
+
+        response = api_client.get('/ready/')
+
+        data = response.json()
+        assert response.status_code == 503
+        assert data['status'] == 'unavailable'
+        assert data['checks']['database:default'] == {
+            'ok': False, 'latency_ms': data['checks']['database:default']['latency_ms'],
+            'error': 'ConnectionError',
+        }
+
+    def test_hung_probe_does_not_block_other_callers(self, api_client, monkeypatch, settings):
+        """
+        Test callers answer from the last result, then 503, while a probe hangs.
+        """
+        settings.READINESS_CACHE_TTL = 0
+        release, entered = threading.Event(), threading.Event()
+        monkeypatch.setattr(health, 'probe_queue', lambda: None)
+        api_client.get('/ready/')
+
+        def hung(alias):
+            entered.set()
+            release.wait(5)
+
+        monkeypatch.setattr(health, 'probe_database', hung)
+        prober = threading.Thread(target=health.readiness)
+        prober.start()
+        try:
+            assert entered.wait(5)
+            assert api_client.get('/ready/').status_code == 200
+
+            monkeypatch.setattr(health, 'STALE_GRACE', 0)
+            response = api_client.get('/ready/')
+            assert response.status_code == 503
+            assert response.json()['checks']['probes']['error'] == 'ProbeInProgress'
+        finally:
+            release.set()
+            prober.join()
+
+    def test_shared_cache_is_probed(self, api_client, settings):
+        """
+        Test non-local cache backends get a set/get probe.
+        """
+        settings.CACHES = {
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+            'shared': {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': 'missing_table'},
+        }
+
+        data = api_client.get('/ready/').json()
+
+        assert 'cache:default' not in data['checks']
+        assert data['checks']['cache:shared']['ok'] is False
+        assert data['status'] == 'unavailable'
+
+    def test_check_ready_command(self, api_client, monkeypatch, capsys):
+        """
+        Test check_ready prints each probe and fails when not ready.
+        """
+        call_command('check_ready')
+        assert 'database:default: ok' in capsys.readouterr().out
+
+        monkeypatch.setattr(health, 'probe_queue', lambda: 1 / 0)
+        with pytest.raises(CommandError):
+            call_command('check_ready', '--wait', '0')
+        assert 'queue: FAILED' in capsys.readouterr().out
+
+
+def test_check_ready_databases_only_before_migrate(tmp_path):
+    """
+    Test --databases-only passes on an unmigrated database the full check fails on.
+    """
+    env = {**os.environ, 'DATABASE_URL': f'sqlite:///{tmp_path / "fresh.sqlite3"}'}
+
+    def check_ready(*args):
+        return subprocess.run(
+            [sys.executable, 'manage.py', 'check_ready', *args],
+            cwd=django_settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+
+    full = check_ready()
+    assert full.returncode == 1
+    assert 'queue: FAILED' in full.stdout
+
+    databases_only = check_ready('--databases-only')
+    assert databases_only.returncode == 0
+    assert 'database:default: ok' in databases_only.stdout
+    assert 'queue' not in databases_only.stdout
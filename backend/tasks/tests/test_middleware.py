@@ -0,0 +1,85 @@
+"""
+Tests for lean middleware dispatch (taskcloud.dispatch).
+
+Requests are sent straight to the WSGI dispatcher so the real per-path
+middleware chains are exercised, rather than the test client's handler.
+"""
+import pytest
+from io import BytesIO
+from wsgiref.util import setup_testing_defaults
+from django.core.handlers.wsgi import WSGIHandler
+from taskcloud.dispatch import WSGIPathDispatcher, get_wsgi_application
+
+
+def call_wsgi(app, path):
+    """Issue a GET to a WSGI app; return (status, headers dict, body)."""
+    environ = {
+        'PATH_INFO': path,
+        'HTTP_HOST': 'localhost',
+        'HTTP_ACCEPT': 'application/json',
+        'wsgi.input': BytesIO(),
+    }
+    setup_testing_defaults(environ)
+    captured = {}
+
+    def start_response(status, headers, exc_info=None):
+        captured['status'] = status
+        captured['headers'] = dict(headers)
+
+    body = b''.join(app(environ, start_response))
+    return int(captured['status'].split()[0]), captured['headers'], body
+
+
+@pytest.fixture
+def wsgi_app():
+    return get_wsgi_application()
+
+
+@pytest.mark.django_db
+class TestLeanMiddlewareDispatch:
+    """Test suite for routing /api/ and /health/ through the lean chain."""
+
+    def test_dispatcher_installed(self, wsgi_app):
+        """
+        Test get_wsgi_application returns the dispatcher by default.
+        """
+        assert isinstance(wsgi_app, WSGIPathDispatcher)
+        assert '/api/' in wsgi_app.prefixes
+        assert '/health/' in wsgi_app.prefixes
+
+    def test_health_uses_lean_chain(self, wsgi_app):
+        """
+        Test /health/ skips clickjacking middleware (no X-Frame-Options).
+        """
+        status_code, headers, body = call_wsgi(wsgi_app, '/health/')
+
+        assert status_code == 200
+        assert b'healthy' in body
+        assert 'X-Frame-Options' not in headers
+
+    def test_api_uses_lean_chain(self, wsgi_app):
+        """
+        Test /api/tasks/ is served without the full stack.
+        """
+        status_code, headers, body = call_wsgi(wsgi_app, '/api/tasks/')
+
+        assert status_code == 200
+        assert body == b'[]'
+        assert 'X-Frame-Options' not in headers
+
+    def test_admin_keeps_full_stack(self, wsgi_app):
+        """
+        Test /admin/ still runs the full MIDDLEWARE list.
+        """
+        status_code, headers, _ = call_wsgi(wsgi_app, '/admin/login/')
+
+        assert status_code == 200
+        assert headers.get('X-Frame-Options') == 'DENY'
+
+    def test_disabled_by_empty_paths(self, settings):
+        """
+        Test an empty LEAN_MIDDLEWARE_PATHS returns the plain handler.
+        """
+        settings.LEAN_MIDDLEWARE_PATHS = []
+
+        assert isinstance(get_wsgi_application(), WSGIHandler)
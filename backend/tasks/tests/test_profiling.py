@@ -0,0 +1,87 @@
+"""
+Tests for on-demand request profiling (taskcloud.profiling).
+"""
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from taskcloud.profiling import list_profiles
+from tasks.models import Task
+
+
+@pytest.fixture
+def profiling(settings, tmp_path):
+    """Enable profiling into a temporary ring directory."""
+    settings.PROFILING_ENABLED = True
+    settings.PROFILING_SAMPLE_EVERY = 0
+    settings.PROFILING_TOKEN = 'secret'
+    settings.PROFILING_DIR = tmp_path
+    settings.PROFILING_MAX_FILES = 2
+    settings.PROFILING_SAMPLE_INTERVAL = 0.0001
+    return settings
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    """Test suite for sampled and header-triggered profiles."""
+
+    def test_disabled_by_default(self, settings, tmp_path):
+        """
+        Test no profile is written when profiling is disabled.
+        """
+        settings.PROFILING_DIR = tmp_path
+        response = APIClient().get('/api/tasks/', HTTP_X_TASKCLOUD_PROFILE='secret')
+
+        assert 'X-Profile-Id' not in response
+        assert list_profiles(tmp_path) == []
+
+    def test_header_with_token(self, profiling, tmp_path):
+        """
+        Test a request with the authorized header is profiled.
+
+        Expected:
+        - .prof and .collapsed files are written
+        - The response names the profile
+        """
+        for i in range(20):
+            Task.objects.create(title=f'Task {i}')
+        response = APIClient().get('/api/tasks/', HTTP_X_TASKCLOUD_PROFILE='secret')
+
+        profile_id = response['X-Profile-Id']
+        assert (tmp_path / f'{profile_id}.prof').exists()
+        collapsed = (tmp_path / f'{profile_id}.collapsed').read_text()
+        assert 'get_response' in collapsed
+        assert collapsed.splitlines()[0].rsplit(' ', 1)[1].isdigit()
+
+    def test_wrong_token_not_profiled(self, profiling, tmp_path):
+        """
+        Test a request with the wrong token is not profiled.
+        """
+        response = APIClient().get('/api/tasks/', HTTP_X_TASKCLOUD_PROFILE='guess')
+
+        assert 'X-Profile-Id' not in response
+
+    def test_sample_every_nth_and_ring(self, profiling, tmp_path):
+        """
+        Test every Nth request is profiled and old profiles are trimmed.
+        """
+        profiling.PROFILING_SAMPLE_EVERY = 2
+        client = APIClient()
+
+        responses = [client.get('/api/tasks/') for _ in range(6)]
+
+        assert ['X-Profile-Id' in r for r in responses] == [False, True] * 3
+        assert len(list_profiles(tmp_path)) == 2
+        assert len(list(tmp_path.glob('*.collapsed'))) == 2
+
+    def test_profile_report(self, profiling, tmp_path):
+        """
+        Test profile_report summarizes the saved profiles.
+        """
+        APIClient().get('/api/tasks/', HTTP_X_TASKCLOUD_PROFILE='secret')
+        out = StringIO()
+
+        call_command('profile_report', '--limit', '5', stdout=out)
+
+        assert 'Summary of 1 profiles' in out.getvalue()
+        assert 'function calls' in out.getvalue()
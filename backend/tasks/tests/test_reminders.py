@@ -0,0 +1,151 @@
+"""
+Tests for the due-date reminder scheduler (tasks.reminders).
+
+The scheduler is driven with a fake clock so windows and firing can be
+stepped through deterministically.
+"""
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.utils import timezone
+from tasks.models import ReminderFired, ReminderState, Task
+from tasks.reminders import MemoryReminderSink, ReminderScheduler
+
+
+class FakeClock:
+    """Manually advanced replacement for timezone.now."""
+
+    def __init__(self):
+        self.now = timezone.now()
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sink():
+    return MemoryReminderSink()
+
+
+def make_scheduler(sink, clock, **kwargs):
+    kwargs.setdefault('window', timedelta(seconds=60))
+    kwargs.setdefault('lead', timedelta(0))
+    return ReminderScheduler([sink], clock=clock, **kwargs)
+
+
+@pytest.mark.django_db
+class TestReminderScheduler:
+    """Test suite for window loading and heap-driven firing."""
+
+    def test_fires_in_due_order(self, sink, clock):
+        """
+        Test reminders fire once their due date passes, earliest first.
+        """
+        later = Task.objects.create(title='Later', due_date=clock.now + timedelta(seconds=20))
+        sooner = Task.objects.create(title='Sooner', due_date=clock.now + timedelta(seconds=10))
+        scheduler = make_scheduler(sink, clock)
+
+        assert scheduler.run_once() == 0
+        assert scheduler.next_wakeup() == sooner.due_date
+
+        clock.advance(seconds=30)
+        assert scheduler.run_once() == 2
+        assert [r.task_id for r in sink.events] == [str(sooner.id), str(later.id)]
+
+    def test_skips_completed_and_undated(self, sink, clock):
+        """
+        Test completed tasks and tasks without due_date never fire.
+        """
+        Task.objects.create(title='Done', due_date=clock.now + timedelta(seconds=5), is_completed=True)
+        Task.objects.create(title='No date')
+        scheduler = make_scheduler(sink, clock)
+
+        scheduler.run_once()
+        clock.advance(seconds=30)
+
+        assert scheduler.run_once() == 0
+
+    def test_task_added_mid_window_fires_once(self, sink, clock):
+        """
+        Test a task created after its window loaded fires at the next load, once.
+        """
+        scheduler = make_scheduler(sink, clock)
+        scheduler.run_once()
+        clock.advance(seconds=5)
+        task = Task.objects.create(title='Late add', due_date=clock.now + timedelta(seconds=5))
+
+        clock.advance(seconds=10)
+        assert scheduler.run_once() == 0
+        clock.advance(seconds=50)
+        assert scheduler.run_once() == 1
+        clock.advance(seconds=60)
+        assert scheduler.run_once() == 0
+        assert [r.task_id for r in sink.events] == [str(task.id)]
+
+    def test_lead_time(self, sink, clock):
+        """
+        Test reminders fire `lead` before the due date.
+        """
+        Task.objects.create(title='Meeting', due_date=clock.now + timedelta(minutes=10))
+        scheduler = make_scheduler(sink, clock, lead=timedelta(minutes=10))
+
+        assert scheduler.run_once() == 1
+
+    def test_restart_neither_drops_nor_repeats(self, sink, clock):
+        """
+        Test a restarted scheduler fires what came due while down, and nothing twice.
+        """
+        fired = Task.objects.create(title='Fired', due_date=clock.now + timedelta(seconds=10))
+        missed = Task.objects.create(title='Missed', due_date=clock.now + timedelta(seconds=40))
+        scheduler = make_scheduler(sink, clock)
+        scheduler.run_once()
+        clock.advance(seconds=20)
+        assert scheduler.run_once() == 1
+
+        # Down for ten minutes, then a fresh process with empty memory.
+        clock.advance(minutes=10)
+        restarted = make_scheduler(sink, clock)
+        assert restarted.run_once() == 1
+        clock.advance(seconds=60)
+        assert restarted.run_once() == 0
+
+        assert [r.task_id for r in sink.events] == [str(fired.id), str(missed.id)]
+
+    def test_markers_pruned_below_watermark(self, sink, clock):
+        """
+        Test fired markers are deleted once no reload can read them again.
+        """
+        Task.objects.create(title='Soon', due_date=clock.now + timedelta(seconds=10))
+        scheduler = make_scheduler(sink, clock)
+        scheduler.run_once()
+        clock.advance(seconds=20)
+        scheduler.run_once()
+        assert ReminderFired.objects.count() == 1
+
+        clock.advance(seconds=60)
+        scheduler.run_once()
+        clock.advance(seconds=60)
+        scheduler.run_once()
+
+        assert not ReminderFired.objects.exists()
+        assert ReminderState.objects.get().watermark == clock.now - timedelta(seconds=60)
+
+    def test_command_once(self, clock):
+        """
+        Test run_reminder_scheduler --once fires overdue reminders with catch-up.
+        """
+        Task.objects.create(title='Overdue', due_date=timezone.now() - timedelta(seconds=30))
+
+        from io import StringIO
+        out = StringIO()
+        call_command('run_reminder_scheduler', '--once', '--catch-up', '60', stdout=out)
+
+        assert 'Fired 1 reminders' in out.getvalue()
@@ -0,0 +1,97 @@
+"""
+Tests for the slow-query log (taskcloud.slow_queries).
+"""
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from taskcloud import slow_queries
+from tasks.models import Task
+
+
+@pytest.fixture
+def slow_log(settings, tmp_path):
+    """Log every query to a temporary file."""
+    settings.SLOW_QUERY_THRESHOLD_MS = 0
+    settings.SLOW_QUERY_LOG = tmp_path / 'slow.jsonl'
+    slow_queries._explained.clear()
+    return settings.SLOW_QUERY_LOG
+
+
+def read_log(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_fingerprint_normalizes_literals():
+    """
+    Test queries differing only in literals and IN-list size share a fingerprint.
+    """
+    a = 'SELECT * FROM t WHERE id IN (%s, %s) AND name = \'x\' LIMIT 21'
+    b = 'SELECT  *  FROM t WHERE id IN (%s, %s, %s) AND name = \'yy\' LIMIT 5'
+
+    assert slow_queries.fingerprint(a) == slow_queries.fingerprint(b)
+    assert slow_queries.fingerprint(a) != slow_queries.fingerprint('SELECT 1 FROM u')
+
+
+@pytest.mark.django_db
+class TestSlowQueryLog:
+    """Test suite for logging, EXPLAIN capture and aggregation."""
+
+    def test_logs_view_query_with_plan(self, slow_log):
+        """
+        Test a task list query is logged with its view and SQLite plan.
+
+        Expected:
+        - Source names the DRF view
+        - The first entry for the fingerprint carries an EXPLAIN plan
+        """
+        Task.objects.create(title='Seen')
+        slow_log.unlink(missing_ok=True)
+
+        APIClient().get('/api/tasks/')
+
+        entries = [e for e in read_log(slow_log) if 'tasks_task' in e['sql']]
+        assert entries[0]['source'] == 'view:tasks:task-list-create'
+        assert entries[0]['explain']
+        assert any('created' in step for step in entries[0]['explain'])
+
+    def test_explain_captured_once(self, slow_log):
+        """
+        Test repeated queries are explained only the first time.
+        """
+        list(Task.objects.filter(title='a'))
+        list(Task.objects.filter(title='b'))
+
+        entries = [e for e in read_log(slow_log) if 'tasks_task' in e['sql']]
+        assert len(entries) == 2
+        assert entries[0]['fingerprint'] == entries[1]['fingerprint']
+        assert 'explain' in entries[0]
+        assert 'explain' not in entries[1]
+
+    def test_threshold_filters(self, slow_log, settings):
+        """
+        Test queries under the threshold are not logged.
+        """
+        settings.SLOW_QUERY_THRESHOLD_MS = 10_000
+
+        list(Task.objects.all())
+
+        assert not slow_log.exists()
+
+    def test_command_aggregates(self, slow_log):
+        """
+        Test slow_queries groups entries by fingerprint with count and timings.
+        """
+        with slow_queries.query_source('command:cleanup_expired_tasks'):
+            for title in ('a', 'b', 'c'):
+                list(Task.objects.filter(title=title))
+        out = StringIO()
+
+        call_command('slow_queries', '--sort', 'count', '--explain', '--clear', stdout=out)
+
+        output = out.getvalue()
+        assert 'count=3' in output
+        assert 'command:cleanup_expired_tasks x3' in output
+        assert 'plan:' in output
+        assert not slow_log.exists()
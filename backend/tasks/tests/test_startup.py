@@ -0,0 +1,96 @@
+"""
+Tests for lazy-loaded URL views and the startup report (taskcloud.startup).
+"""
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+from rest_framework.test import APIClient
+from taskcloud.startup import PHASE_MARKER, parse_importtime
+from taskcloud.urls import _lazy_view
+
+IMPORTTIME_OUTPUT = f"""\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | encodings
+{PHASE_MARKER} setup
+import time:      2000 |       2000 |   django.db.models
+import time:      1000 |       3000 | django.db
+import time:       500 |        500 | django.contrib.admin.sites
+{PHASE_MARKER} first request
+import time:      4000 |       4000 | drf_spectacular.views
+Internal Server Error: /api/tasks/
+"""
+
+
+class TestLazyView:
+    """Test suite for taskcloud.urls._lazy_view."""
+
+    def test_imports_view_on_first_request(self, monkeypatch, rf):
+        """
+        Test the view class is imported once, on first use, with initkwargs.
+        """
+        imported = []
+
+        class FakeView:
+            @classmethod
+            def as_view(cls, **initkwargs):
+                return lambda request: ('view', initkwargs)
+
+        def import_string(path):
+            imported.append(path)
+            return FakeView
+
+        monkeypatch.setattr('taskcloud.urls.import_string', import_string)
+        view = _lazy_view('docs.FakeView', url_name='schema')
+        assert imported == []
+
+        assert view(rf.get('/')) == ('view', {'url_name': 'schema'})
+        view(rf.get('/'))
+        assert imported == ['docs.FakeView']
+        assert view.csrf_exempt
+
+    @pytest.mark.django_db
+    def test_docs_views_still_served(self):
+        """
+        Test the lazily loaded schema and Swagger UI views respond.
+        """
+        client = APIClient()
+
+        assert client.get('/api/schema/').status_code == 200
+        response = client.get('/api/docs/')
+        assert response.status_code == 200
+        assert b'../schema/' in response.content
+
+
+class TestStartupReport:
+    """Test suite for import-time parsing and the startup_report command."""
+
+    def test_parse_importtime_groups_by_phase_and_package(self):
+        """
+        Test imports are attributed to the phase marker preceding them.
+        """
+        breakdown = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert breakdown['interpreter'] == {'encodings': [1, 0.0001]}
+        assert breakdown['setup'] == {'django': [2, 0.003], 'django.contrib.admin': [1, 0.0005]}
+        assert breakdown['first request'] == {'drf_spectacular': [1, 0.004]}
+        assert breakdown['application'] == {}
+
+    def test_startup_report_json(self, capsys):
+        """
+        Test the command boots a fresh process and reports every phase.
+        """
+        call_command('startup_report', '--runs', '1', '--json', '--top', '3')
+
+        report = json.loads(capsys.readouterr().out)
+        assert report['status'] == '200 OK'
+        assert set(report['phases_ms']) == {'setup', 'application', 'first request', 'second request'}
+        assert report['first_request_ms'] > 0
+        assert len(report['imports']) == 3
+
+    def test_startup_report_budget(self):
+        """
+        Test exceeding --budget-ms fails the command.
+        """
+        with pytest.raises(CommandError, match='exceeds budget'):
+            call_command('startup_report', '--runs', '1', '--json', '--budget-ms', '0')
@@ -0,0 +1,145 @@
+"""
+Tests for maintained task counters and GET /api/tasks/stats/.
+"""
+import pytest
+from datetime import timedelta
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from tasks import counters
+from tasks.models import Task, TaskStats
+from tasks.views import TaskDetailView
+
+
+@pytest.fixture
+def api_client():
+    """Provide DRF API client for tests."""
+    return APIClient()
+
+
+def get_stats(api_client):
+    response = api_client.get('/api/tasks/stats/')
+    assert response.status_code == status.HTTP_200_OK
+    return response.data
+
+
+@pytest.mark.django_db
+class TestTaskStatsAPI:
+    """Test suite for GET /api/tasks/stats/ and counter maintenance."""
+
+    def test_empty_stats(self, api_client):
+        """
+        Test stats are all zero with no tasks.
+        """
+        data = get_stats(api_client)
+
+        assert data['total'] == 0
+        assert data['completed'] == 0
+        assert data['active'] == 0
+
+    def test_counters_follow_api_writes(self, api_client):
+        """
+        Test create, toggle and delete through the API adjust the counters.
+        """
+        first = api_client.post('/api/tasks/', {'title': 'A'}, format='json').data
+        api_client.post('/api/tasks/', {'title': 'B', 'is_completed': True}, format='json')
+        assert get_stats(api_client) | {'reconciled_at': None} == {
+            'total': 2, 'completed': 1, 'active': 1,
+            'overdue': 0, 'due_soon': 0, 'reconciled_at': None,
+        }
+
+        api_client.patch(f"/api/tasks/{first['id']}/", {'is_completed': True}, format='json')
+        assert get_stats(api_client)['completed'] == 2
+
+        api_client.delete(f"/api/tasks/{first['id']}/")
+        data = get_stats(api_client)
+        assert data['total'] == 1
+        assert data['completed'] == 1
+        assert data['active'] == 0
+
+    def test_stats_do_not_scan_tasks(self, api_client):
+        """
+        Test the endpoint reads only the counters table.
+        """
+        Task.objects.create(title='Unseen')
+        counters.reconcile()
+
+        with CaptureQueriesContext(connection) as ctx:
+            get_stats(api_client)
+
+        assert not any('tasks_task"' in q['sql'] for q in ctx.captured_queries)
+
+    def test_cleanup_updates_counters(self, api_client):
+        """
+        Test cleanup_expired_tasks subtracts the deleted tasks.
+        """
+        old = Task.objects.create(title='Old', is_completed=True)
+        Task.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        Task.objects.create(title='New')
+        counters.reconcile()
+
+        call_command('cleanup_expired_tasks')
+
+        data = get_stats(api_client)
+        assert data['total'] == 1
+        assert data['completed'] == 0
+
+    def test_reconcile_counts_overdue_and_due_soon(self, api_client):
+        """
+        Test reconciliation recomputes every counter in one query.
+        """
+        now = timezone.now()
+        Task.objects.create(title='Overdue', due_date=now - timedelta(hours=1))
+        Task.objects.create(title='Due soon', due_date=now + timedelta(hours=1))
+        Task.objects.create(title='Later', due_date=now + timedelta(days=7))
+        Task.objects.create(title='Done late', due_date=now - timedelta(hours=1), is_completed=True)
+
+        call_command('reconcile_task_stats')
+
+        data = get_stats(api_client)
+        assert data['total'] == 4
+        assert data['completed'] == 1
+        assert data['overdue'] == 1
+        assert data['due_soon'] == 1
+        assert data['reconciled_at'] is not None
+
+    def test_missing_row_is_rebuilt(self, api_client):
+        """
+        Test deltas against a missing counters row trigger reconciliation.
+        """
+        TaskStats.objects.all().delete()
+        api_client.post('/api/tasks/', {'title': 'A'}, format='json')
+
+        assert get_stats(api_client)['total'] == 1
+
+    def test_stale_snapshot_is_reconciled_on_read(self, api_client, settings):
+        """
+        Test overdue counts are fresh before the first periodic reconcile runs.
+        """
+        settings.TASK_STATS_MAX_AGE = timedelta(minutes=10)
+        Task.objects.create(title='Overdue', due_date=timezone.now() - timedelta(hours=1))
+        TaskStats.objects.update(reconciled_at=None)
+
+        assert get_stats(api_client)['overdue'] == 1
+
+        Task.objects.create(title='Also overdue', due_date=timezone.now() - timedelta(hours=1))
+        assert get_stats(api_client)['overdue'] == 1
+        TaskStats.objects.update(reconciled_at=timezone.now() - timedelta(minutes=11))
+        assert get_stats(api_client)['overdue'] == 2
+
+    def test_delete_of_already_deleted_task_counts_once(self):
+        """
+        Test a delete that lost a race with another delete leaves the counters alone.
+        """
+        task = Task.objects.create(title='Raced')
+        Task.objects.create(title='Kept')
+        counters.reconcile()
+        # The concurrent request's delete, already counted.
+        counters.delete_tasks(Task.objects.filter(pk=task.pk))
+
+        TaskDetailView().perform_destroy(task)
+
+        assert TaskStats.objects.get().total == 1
@@ -8,5 +8,8 @@ app_name = 'tasks'
 
 urlpatterns = [
     path('', views.TaskListCreateView.as_view(), name='task-list-create'),
+    path('stats/', views.TaskStatsView.as_view(), name='task-stats'),
+    path('export/', views.TaskExportView.as_view(), name='task-export'),
+    path('import/', views.TaskImportView.as_view(), name='task-import'),
     path('<uuid:pk>/', views.TaskDetailView.as_view(), name='task-detail'),
 ]
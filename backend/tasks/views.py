@@ -4,25 +4,167 @@ DRF views for Task CRUD operations.
 Uses generic class-based views (ListCreateAPIView, RetrieveUpdateDestroyAPIView)
 for clean, reusable endpoint logic.
 """
-from rest_framework import generics
+from django.conf import settings
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from . import bulk, counters
 from .models import Task
-from .serializers import TaskSerializer
+from .serializers import TaskImportResultSerializer, TaskSerializer, TaskStatsSerializer
 
 
-class TaskListCreateView(generics.ListCreateAPIView):
+class SparseFieldsetMixin:
+    """
+    Support `?fields=id,title,is_completed` projections on read requests.
+
+    The requested fields are validated against the serializer, pushed down
+    into the SELECT column list with `.only()`, and passed on to the
+    serializer so the response carries nothing else. Write requests always
+    use the full serializer so validation is unaffected.
+    """
+    fields_param = 'fields'
+
+    def get_sparse_fields(self):
+        """Return the requested field names, or None when not projecting."""
+        if self.request.method != 'GET':
+            return None
+        raw = self.request.query_params.get(self.fields_param)
+        if not raw:
+            return None
+        requested = [name.strip() for name in raw.split(',') if name.strip()]
+        allowed = self.get_serializer_class().Meta.fields
+        unknown = [name for name in requested if name not in allowed]
+        if unknown:
+            raise ValidationError({
+                self.fields_param: f"Unknown field(s): {', '.join(unknown)}",
+            })
+        return requested or None
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if fields:
+            queryset = queryset.only(*fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_sparse_fields()
+        if fields:
+            kwargs.setdefault('fields', fields)
+        return super().get_serializer(*args, **kwargs)
+
+
+class TaskListCreateView(SparseFieldsetMixin, generics.ListCreateAPIView):
     """
     GET /api/tasks/ - List all tasks (ordered by newest first).
     POST /api/tasks/ - Create a new task.
+
+    Supports `?fields=...` on GET to return a subset of task fields.
     """
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
 
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            task = serializer.save()
+            counters.record_created(task)
+
 
-class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
+class TaskDetailView(SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     GET /api/tasks/<uuid:pk>/ - Retrieve a single task.
     PATCH /api/tasks/<uuid:pk>/ - Partial update (e.g., toggle is_completed).
     DELETE /api/tasks/<uuid:pk>/ - Delete a task.
+
+    Supports `?fields=...` on GET to return a subset of task fields.
     """
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
+
+    def perform_update(self, serializer):
+        was_completed = serializer.instance.is_completed
+        with transaction.atomic():
+            task = serializer.save()
+            counters.record_updated(was_completed, task)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            # 0 when a concurrent request already deleted the task.
+            if instance.delete()[0]:
+                counters.record_deleted(instance)
+
+
+class TaskStatsView(generics.RetrieveAPIView):
+    """
+    GET /api/tasks/stats/ - Task counts (total, completed, active, overdue, due_soon).
+
+    Served from maintained counters; the task table is never scanned here.
+    """
+    serializer_class = TaskStatsSerializer
+
+    def get_object(self):
+        return counters.get_stats()
+
+
+class TaskExportView(APIView):
+    """
+    GET /api/tasks/export/ - Stream every task as NDJSON (one JSON object per line).
+    """
+    throttle_scope = 'bulk'
+    # Only error responses (e.g. throttling) go through a renderer.
+    renderer_classes = [JSONRenderer]
+
+    @extend_schema(responses={(200, 'application/x-ndjson'): OpenApiTypes.STR})
+    def get(self, request, *args, **kwargs):
+        return StreamingHttpResponse(bulk.export_lines(), content_type='application/x-ndjson')
+
+
+class TaskImportView(APIView):
+    """
+    POST /api/tasks/import/ - Bulk-create tasks from an NDJSON request body.
+
+    The body is read line by line and inserted in chunks; invalid lines are
+    skipped and reported. At most TASK_IMPORT_API_MAX_ROWS lines are read;
+    bodies over TASK_IMPORT_API_MAX_BYTES get a 413 and lines over
+    TASK_IMPORT_API_MAX_LINE_BYTES are rejected. Client-supplied `id` and
+    `created_at` are ignored, as in TaskSerializer.
+    """
+    throttle_scope = 'bulk'
+    # The body is read from request.stream, never parsed. The browsable API
+    # needs a parser to build its form, so it is not offered here.
+    parser_classes = []
+    renderer_classes = [JSONRenderer]
+
+    @extend_schema(
+        request={'application/x-ndjson': OpenApiTypes.STR},
+        responses={201: TaskImportResultSerializer, 400: TaskImportResultSerializer, 413: OpenApiTypes.OBJECT},
+    )
+    def post(self, request, *args, **kwargs):
+        # request.stream is limited to Content-Length (a body without one
+        # reads as empty), so checking the header bounds the whole read.
+        max_bytes = getattr(settings, 'TASK_IMPORT_API_MAX_BYTES', 16 * 1024 * 1024)
+        try:
+            content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > max_bytes:
+            return Response(
+                {'detail': f'Request body exceeds {max_bytes} bytes.'},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        max_line_bytes = getattr(settings, 'TASK_IMPORT_API_MAX_LINE_BYTES', 64 * 1024)
+        stream = request.stream
+        lines = bulk.read_lines(stream, max_line_bytes) if stream is not None else []
+        result = bulk.import_lines(
+            lines,
+            max_rows=getattr(settings, 'TASK_IMPORT_API_MAX_ROWS', 10000),
+            max_line_bytes=max_line_bytes,
+        )
+        code = status.HTTP_201_CREATED if result.imported else status.HTTP_400_BAD_REQUEST
+        return Response(result.as_dict(), status=code)